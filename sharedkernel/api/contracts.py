@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Sequence, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -19,6 +20,17 @@ class Response(BaseModel):
     An API contract that defines as a standard HTTP response structure.
     """
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the response to JSON using its field aliases.
+
+        Calls the compiled model serializer directly and returns the encoded
+        bytes, ready to be written as an HTTP response body.
+
+        Returns:
+            JSON encoded response.
+        """
+        return self.__pydantic_serializer__.to_json(self, by_alias=True)
+
 
 class AckData(BaseModel):
     """Command Acknowledgement data
@@ -63,6 +75,29 @@ class ProblemDetail(Response):
     msg: str
     type: str
 
+    @staticmethod
+    def cached_json_bytes(loc: Sequence[str], msg: str, problem_type: str) -> bytes:
+        """Serialize a problem detail to JSON, reusing the result for repeated problems.
+
+        Identical problems, like the same validation failing over and over, are
+        serialized once and then served from a bounded cache.
+
+        Args:
+            loc: A reference that identifies the specific instance where the problem occurred.
+            msg: A short summary to describe the type of problem in general.
+            problem_type: Identifies the problem type.
+
+        Returns:
+            JSON encoded problem detail.
+        """
+        return _problem_json_bytes(tuple(loc), msg, problem_type)
+
+
+@lru_cache(maxsize=256)
+def _problem_json_bytes(loc: Tuple[str, ...], msg: str, problem_type: str) -> bytes:
+    """Serialize a problem detail to JSON once per distinct location, message and type."""
+    return ProblemDetail(loc=list(loc), msg=msg, type=problem_type).to_json_bytes()
+
 
 class ErrorResponse(ProblemDetail):
     """ErrorResponse
@@ -1,5 +1,6 @@
 from collections import deque
-from typing import get_args, Generic, TypeVar, Deque
+from functools import lru_cache
+from typing import get_args, Generic, TypeVar, Deque, Dict
 from abc import abstractmethod, ABC
 from types import get_original_bases
 from typing import Optional, Self
@@ -13,6 +14,14 @@ TRequest = TypeVar("TRequest", bound=Request)
 TMessage = TypeVar("TMessage", bound=Command | Query)
 
 
+@lru_cache(maxsize=None)
+def _request_type(mapper_class: type) -> str:
+    """Resolve the name of the Request type mapped by a Request Mapper class."""
+    bases = get_original_bases(mapper_class)
+    args = get_args(bases[0])
+    return args[0].__name__
+
+
 class RequestMapper(ABC, Generic[TRequest]):
 
     def __init__(self):
@@ -20,9 +29,7 @@ class RequestMapper(ABC, Generic[TRequest]):
 
     @property
     def request_type(self) -> str:
-        bases = get_original_bases(self.__class__)
-        args = get_args(bases[0])
-        return args[0].__name__
+        return _request_type(self.__class__)
 
     def set_next(self, mapper: Self):
         self._next = mapper
@@ -49,6 +56,7 @@ class RequestMappersChain(RequestMappingBehavior):
     def __init__(self):
         self._mappers: Deque[RequestMapper] = deque()
         self._first: Optional[RequestMapper] = None
+        self._by_type: Dict[str, RequestMapper] = dict()
 
     def __call__(self, request: TRequest, **query_params) -> TMessage:
         return self.map(request, **query_params)
@@ -59,13 +67,17 @@ class RequestMappersChain(RequestMappingBehavior):
 
         self._mappers.appendleft(mapper)
         self._first = mapper
+        self._by_type[mapper.request_type] = mapper
 
     def map(self, request: TRequest, **query_params) -> TMessage:
-        if not self._first:
-            raise RequestMapperNotFound(self, type(request).__name__)
+        request_type = type(request).__name__
+        # Mappers may also serve other request types, like subclasses, through the linked chain.
+        mapper = self._by_type.get(request_type, self._first)
+        if not mapper:
+            raise RequestMapperNotFound(self, request_type)
 
-        message = self._first.map(request, **query_params)
+        message = mapper.map(request, **query_params)
         if not message:
-            raise RequestMapperNotFound(self, type(request).__name__)
+            raise RequestMapperNotFound(self, request_type)
 
         return message
@@ -4,7 +4,7 @@ from sharedkernel.api.contracts import AckResponse, AckData
 from sharedkernel.application.commands import Acknowledgement
 
 
-@dataclass
+@dataclass(slots=True)
 class ElapsedTime:
     value: float
 
@@ -12,6 +12,10 @@ class ElapsedTime:
     def from_delta(cls, start: float, end: float):
         return cls(end - start)
 
+    @classmethod
+    def from_delta_ns(cls, start_ns: int, end_ns: int):
+        return cls((end_ns - start_ns) / 1_000_000_000)
+
     @property
     def milliseconds(self):
         return round(self.value * 1000)
@@ -27,3 +31,13 @@ class AckResponseModel:
         )
 
         return AckResponse(status=ack.status, data=data)
+
+    @staticmethod
+    def to_json_bytes(ack: Acknowledgement) -> bytes:
+        data = AckData.model_construct(
+            action=ack.action,
+            entity_id=ack.entity_id,
+            version=ack.version,
+        )
+
+        return AckResponse.model_construct(status=ack.status, data=data).to_json_bytes()
@@ -9,7 +9,7 @@ from result import Result
 from sharedkernel.domain.errors import Error
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command:
     """Command base class
 
@@ -25,7 +25,7 @@ class CommandStatus(StrEnum):
     FAILED = 'failed'
 
 
-@dataclass
+@dataclass(slots=True)
 class Acknowledgement:
     status: CommandStatus
     action: str
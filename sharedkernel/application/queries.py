@@ -8,7 +8,7 @@ from sharedkernel.domain.data import ReadModel, ReadModelList
 from sharedkernel.domain.errors import Error
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Query:
     """Query base class
 
@@ -2,7 +2,7 @@ import typing
 from abc import ABC, abstractmethod
 from logging import Logger
 from types import get_original_bases
-from typing import Dict, TypeVar, Union
+from typing import Dict, Iterable, List, TypeVar, Union
 
 from result import Ok, Err
 
@@ -57,26 +57,27 @@ class ServiceBus:
 
     def __init__(self, logger: Logger) -> None:
         self._logger = logger
-        self._handlers: Dict[str, THandler] = dict()
-        self._validators: Dict[str, Validator] = dict()
+        self._handlers: Dict[type, THandler] = dict()
+        self._validators: Dict[type, Validator] = dict()
 
     def register(self, handler: Union[THandler, Validator]) -> bool:
         bases = get_original_bases(handler.__class__)
         args = typing.get_args(bases[0])
-        request_type = args[0].__name__
+        request_class = args[0]
+        request_type = request_class.__name__
 
-        if request_type in self._handlers:
+        if request_class in self._handlers:
             self._logger.error(f"A handler for {request_type} was already registered")
             raise HandlerAlreadyRegistered(self, request_type)
 
         if isinstance(handler, CommandHandler | QueryHandler):
             self._logger.debug(f"{type(handler).__name__} was successfully registered")
-            self._handlers[request_type] = handler
+            self._handlers[request_class] = handler
             return True
 
         if isinstance(handler, Validator):
             self._logger.debug(f"{type(handler).__name__} was successfully registered")
-            self._validators[request_type] = handler
+            self._validators[request_class] = handler
             return True
 
         self._logger.error(f"{type(self).__name__} cannot register {type(handler).__name__}")
@@ -92,6 +93,18 @@ class ServiceBus:
             self._logger.error(f"A {type(error).__name__} occurred when processing request {type(request).__name__}")
             return Rejection.from_exception(status_code=422, error=error)
 
+    def send_many(self, requests: Iterable[TRequest]) -> List[Union[TResponse, Rejection]]:
+        """Routes a batch of requests to their handlers.
+
+        Args:
+            requests: Commands or Queries to send.
+
+        Returns:
+            The response or rejection of each request, in the same order as the requests.
+        """
+        send = self.send
+        return [send(request) for request in requests]
+
     def process(self, request: TRequest) -> TResponse:
         validation_result = self.pre_process(request)
 
@@ -111,26 +124,23 @@ class ServiceBus:
         return Rejection.from_error(status_code=501, error=error)
 
     def pre_process(self, request: TRequest) -> ValidationResult:
-        request_type = type(request).__name__
+        validator = self._validators.get(type(request))
 
-        if request_type not in self._validators:
+        if validator is None:
             self._logger.debug(f"No validator registered for request {type(request).__name__}")
             return ValidationResult.success()
 
-        validator = self._validators[request_type]
-
         return validator.validate(request)
 
     def process_command(self, command: Command) -> Union[Acknowledgement, Rejection]:
-        command_type = type(command).__name__
+        handler = self._handlers.get(type(command))
 
-        if command_type not in self._handlers:
-            self._logger.warning(f"No handler registered for request {type(command).__name__}")
+        if handler is None:
+            command_type = type(command).__name__
+            self._logger.warning(f"No handler registered for request {command_type}")
             error = ServiceBusErrors.no_handler_registered_for_request(command_type)
             return Rejection.from_error(status_code=501, error=error)
 
-        handler = self._handlers[command_type]
-
         result = handler.execute(command)
 
         match result:
@@ -142,15 +152,14 @@ class ServiceBus:
                 return Rejection.from_error(status_code=status_code, error=error)
 
     def process_query(self, query: Query) -> Union[TResult, Rejection]:
-        query_type = type(query).__name__
+        handler = self._handlers.get(type(query))
 
-        if query_type not in self._handlers:
-            self._logger.warning(f"No handler registered for request {type(query).__name__}")
+        if handler is None:
+            query_type = type(query).__name__
+            self._logger.warning(f"No handler registered for request {query_type}")
             error = ServiceBusErrors.no_handler_registered_for_request(query_type)
             return Rejection.from_error(status_code=501, error=error)
 
-        handler = self._handlers[query_type]
-
         result = handler.execute(query)
 
         match result:
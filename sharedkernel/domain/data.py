@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReadModel:
     """ReadModel base class
 
@@ -10,7 +10,7 @@ class ReadModel:
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReadModelList:
     """ReadModelList class
 
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any
 
 from sharedkernel.domain.events import DomainEvent
@@ -53,7 +53,7 @@ class UnknownEvent(DomainError):
         self.event = event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Error:
     """Error Model
 
@@ -73,4 +73,9 @@ class Error:
     domain: str
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "code": self.code,
+            "message": self.message,
+            "reason": self.reason,
+            "domain": self.domain,
+        }
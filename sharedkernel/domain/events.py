@@ -3,9 +3,13 @@ from abc import ABC, abstractmethod
 from typing import TypeVar, Generic
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEvent:
-    """Domain Event base class"""
+    """Domain Event base class
+
+    Subclasses should also be declared with `@dataclass(frozen=True, slots=True)`,
+    otherwise their instances get a `__dict__` again.
+    """
 
     @property
     def qualname(self):
@@ -8,15 +8,18 @@ from sharedkernel.domain.events import DomainEvent
 from sharedkernel.domain.errors import UnknownEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValueObject:
     """Value Object base class
 
     Immutable object that represents a value in the domain with no identity.
+
+    Subclasses should also be declared with `@dataclass(frozen=True, slots=True)`,
+    otherwise their instances get a `__dict__` again.
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityID(ValueObject):
     """EntityID Value Object
 
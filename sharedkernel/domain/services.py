@@ -1,4 +1,4 @@
-import inspect
+import sys
 from typing import Optional, Any, TypeAlias
 
 
@@ -22,6 +22,8 @@ class Guard:
     To work properly, the validation methods of this Guard class requires
     the caller to be a ``@classmethod`` that defines a `cls` variable which
      contains a reference to the caller class.
+    Alternatively, the name used in the error message can be given explicitly
+    with the `name` argument, which also skips the caller introspection.
     """
 
     @staticmethod
@@ -36,143 +38,156 @@ class Guard:
             KeyError: If the caller is not a class method with a `cls` variable
                 that references its own class.
         """
-        frame = inspect.currentframe()
-        guard = frame.f_back
-        caller = guard.f_back
+        # Skip this frame and the guard clause frame to reach the caller
+        caller = sys._getframe(2)
         # If the caller method is not a class method with cls that reference
         # its own class will throw a 'KeyError'
         class_definition: type = caller.f_locals["cls"]
         return class_definition.__qualname__
 
     @staticmethod
-    def is_not_null(value: Optional[str]) -> None:
+    def is_not_null(value: Optional[str], name: Optional[str] = None) -> None:
         """Ensures that a specified value is not null.
 
         Args:
             value: Current value being validated.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is ``None``.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if value is None:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} cannot be null")
 
     @staticmethod
-    def is_not_empty(value: str) -> None:
+    def is_not_empty(value: str, name: Optional[str] = None) -> None:
         """Ensures that a specified property is not an empty string or
         whitespace.
 
         Args:
             value: Current value being validated.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is an empty string.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
-        if value.strip() == "":
+        if value == "" or value.isspace():
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} cannot be empty")
 
     @staticmethod
-    def is_not_null_or_empty(value: Optional[str]) -> None:
+    def is_not_null_or_empty(value: Optional[str], name: Optional[str] = None) -> None:
         """Ensures that a specified value is not null, an empty string or
         whitespace.
 
         Args:
             value: Current value being validated.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is ``None`` or an empty string.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
-        if value is None or value.strip() == "":
+        if not value or value.isspace():
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} cannot be null nor empty")
 
     @staticmethod
-    def is_null(value: Optional[str]) -> None:
+    def is_null(value: Optional[str], name: Optional[str] = None) -> None:
         """Checks if a property value is null.
 
         It is the opposite of the ``is_not_null`` guard clause.
 
         Args:
             value: Current value being validated.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is not ``None``.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if value is not None:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} must be null")
 
     @staticmethod
-    def is_empty(value: str) -> None:
+    def is_empty(value: str, name: Optional[str] = None) -> None:
         """Checks if a property value is empty.
 
         It is the opposite of the ``is_not_empty`` guard clause.
 
         Args:
             value: Current value being validated.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is not an empty string.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
-        if value.strip() != "":
+        if value != "" and not value.isspace():
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} must be empty")
 
     @staticmethod
-    def is_equal(value: Any, reference_value: Any) -> None:
+    def is_equal(value: Any, reference_value: Any, name: Optional[str] = None) -> None:
         """Ensures that a specified value is equal to a reference value.
 
         Args:
             value: Current value being validated.
             reference_value: Reference value to be compared.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is not equal to the `reference value`.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if value != reference_value:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} should be equal to {reference_value}")
 
     @staticmethod
-    def is_not_equal(value: Any, reference_value: Any) -> None:
+    def is_not_equal(value: Any, reference_value: Any, name: Optional[str] = None) -> None:
         """Ensures that a specified value is not equal to a reference value.
 
         Args:
             value: Current value being validated.
             reference_value: Reference value to be compared.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is equal to the `reference value`.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if value == reference_value:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} should not be equal to {reference_value}")
 
     @staticmethod
-    def maximum_length(value: str, max_length: int) -> None:
+    def maximum_length(value: str, max_length: int, name: Optional[str] = None) -> None:
         """Ensures that the length of a string value is no longer
          than a specified number of characters.
 
@@ -180,20 +195,22 @@ class Guard:
             value: Current value being validated.
             max_length: Number that represents the maximum number of
                 characters.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If the number of characters on `value` is greater than
                 `max_length`.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if len(value) > max_length:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} must be {max_length} characters or less")
 
     @staticmethod
-    def minimum_length(value: str, min_length: int) -> None:
+    def minimum_length(value: str, min_length: int, name: Optional[str] = None) -> None:
         """Ensures that the length of a string value is longer
         than a specified number of characters.
 
@@ -201,86 +218,100 @@ class Guard:
             value: Current value being validated.
             min_length: Number that represents the minimum number of
                 characters.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If the number of characters on `value` is lower than
                 `max_length`.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if len(value) < min_length:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} must be {min_length} characters or more")
 
     @staticmethod
-    def is_less_than(value: Number, reference_value: Number) -> None:
+    def is_less_than(value: Number, reference_value: Number, name: Optional[str] = None) -> None:
         """Ensures that a numeric value is less than a reference value.
 
+        Args:
+            value: Current value being validated.
+            reference_value: Reference value to be compared.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
+
         Raises:
             ValueError: If `value` is not less than `reference_value`.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if not value < reference_value:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} must be less than {reference_value}")
 
     @staticmethod
-    def is_less_than_or_equal(value: Number, reference_value: Number) -> None:
+    def is_less_than_or_equal(value: Number, reference_value: Number, name: Optional[str] = None) -> None:
         """Ensures that a numeric value is less than or equal a reference
         value.
 
         Args:
             value: Current value being validated.
             reference_value: Reference value to be compared.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is greater than `reference_value`.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if value > reference_value:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} must be less than or equal to {reference_value}")
 
     @staticmethod
-    def is_greater_than(value: Number, reference_value: Number) -> None:
+    def is_greater_than(value: Number, reference_value: Number, name: Optional[str] = None) -> None:
         """Ensures that a numeric value is greater than a reference value.
 
         Args:
             value: Current value being validated.
             reference_value: Reference value to be compared.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is not greater than `reference_value`.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if not value > reference_value:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} must be greater than {reference_value}")
 
     @staticmethod
-    def is_greater_than_or_equal(value: Number, reference_value: Number) -> None:
+    def is_greater_than_or_equal(value: Number, reference_value: Number, name: Optional[str] = None) -> None:
         """Ensures that a numeric value is greater than or equal a reference
         value.
 
         Args:
             value: Current value being validated.
             reference_value: Reference value to be compared.
+            name: Name used in the error message. Defaults to the caller
+                class qualified name.
 
         Raises:
             ValueError: If `value` is less than `reference_value`.
-            KeyError: If the caller is not ``@classmethod`` with a `cls`
-                variable that references its own class.
+            KeyError: If `name` is not given and the caller is not
+                ``@classmethod`` with a `cls` variable that references its own
+                class.
         """
-        value_name = Guard._get_caller_name()
-
         if value < reference_value:
+            value_name = name or Guard._get_caller_name()
             raise ValueError(f"{value_name} must be greater than or equal to {reference_value}")
 
 
@@ -359,36 +390,52 @@ class Detect:
         Raises:
             ValueError: If `text` contains SQL reserved word.
         """
+        upper_text = text.upper()
 
-        if "ALTER " in text.upper():
+        if "ALTER " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if "CREATE " in text.upper():
+        if "CREATE " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if "DELETE " in text.upper():
+        if "DELETE " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if "DROP " in text.upper():
+        if "DROP " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if "EXECUTE " in text.upper():
+        if "EXECUTE " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if "INSERT " in text.upper():
+        if "INSERT " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if "MERGE " in text.upper():
+        if "MERGE " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if "SELECT " in text.upper():
+        if "SELECT " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if "UPDATE " in text.upper():
+        if "UPDATE " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if " OR " in text.upper():
+        if " OR " in upper_text:
             raise ValueError("Text contains an invalid word")
 
-        if " TABLE " in text.upper():
+        if " TABLE " in upper_text:
             raise ValueError("Text contains an invalid word")
+
+    @staticmethod
+    def sql_injection(text: str) -> None:
+        """Checks that a given text has SQL special characters or reserved words.
+
+        Special characters are checked first, then reserved words.
+
+        Args:
+            text: Text input being validated.
+
+        Raises:
+            ValueError: If `text` contains a SQL special character or reserved word.
+        """
+        Detect.special_character(text)
+        Detect.reserved_word(text)
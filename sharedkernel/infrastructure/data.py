@@ -1,22 +1,26 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataModel:
     """DataModel base class
 
     Is a Data Transfer Object representing cohesive information in the infrastructure optimized for queries.
+
+    Subclasses should also be declared with `@dataclass(frozen=True, slots=True)`,
+    otherwise their instances get a `__dict__` again.
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event(DataModel):
     event_id: UUID
     event_type: str
     position: int
-    data: str
+    data: str | dict[str, Any]
     stream_id: UUID
     stream_type: str
     version: int
@@ -24,7 +28,7 @@ class Event(DataModel):
     correlation_id: UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     message_id: UUID
     content_type: str
@@ -1,14 +1,15 @@
-import json
 from collections import deque
+from functools import lru_cache
 from datetime import datetime
 from typing import get_args, Generic, TypeVar, Deque, List
 from abc import abstractmethod, ABC
 from types import get_original_bases
-from typing import Dict, Any, Optional, Self
+from typing import Callable, Dict, Any, Optional, Self
 from uuid import UUID
 
 from sharedkernel.domain.events import DomainEvent
 from sharedkernel.infrastructure.data import Event
+from sharedkernel.infrastructure.serialization import json_loads
 
 TEvent = TypeVar("TEvent", bound=DomainEvent)
 
@@ -19,7 +20,7 @@ def extract(data: str) -> str:
     length = len(data)
 
     if length > 0 and data[0] == QUOTES and data[length - 1] == QUOTES:
-        return json.loads(data)
+        return json_loads(data)
 
     return data
 
@@ -39,6 +40,14 @@ def to_event(message: Dict[str, Any], context: Any):
     )
 
 
+@lru_cache(maxsize=None)
+def _mapped_type(mapper_class: type) -> str:
+    """Resolve the name of the Domain Event type produced by a Mapper class."""
+    bases = get_original_bases(mapper_class)
+    args = get_args(bases[0])
+    return args[0].__name__
+
+
 class Mapper(ABC, Generic[TEvent]):
 
     def __init__(self):
@@ -46,9 +55,7 @@ class Mapper(ABC, Generic[TEvent]):
 
     @property
     def event_type(self) -> str:
-        bases = get_original_bases(self.__class__)
-        args = get_args(bases[0])
-        return args[0].__name__
+        return _mapped_type(self.__class__)
 
     def set_next(self, mapper: Self):
         self._next = mapper
@@ -76,6 +83,7 @@ class MappersChain(MappingBehavior):
     def __init__(self):
         self._mappers: Deque[Mapper] = deque()
         self._first: Optional[Mapper] = None
+        self._by_type: Dict[str, Mapper] = dict()
 
     def add(self, mapper: Mapper) -> None:
         if self._first:
@@ -83,14 +91,45 @@ class MappersChain(MappingBehavior):
 
         self._mappers.appendleft(mapper)
         self._first = mapper
+        self._by_type[mapper.event_type] = mapper
 
     def map(self, data: Dict[str, Any], event_type: str) -> Optional[DomainEvent]:
+        mapper = self._by_type.get(event_type)
+        if mapper is not None:
+            return mapper.map(data, event_type)
+
+        # Mappers may also claim event types other than their own, like legacy event names.
         if not self._first:
             return None
 
         return self._first.map(data, event_type)
 
 
+class ConstructorMapping(MappingBehavior):
+    """Maps event data by passing it as keyword arguments to the Domain Event class registered for its type.
+
+    Suitable for events whose data fields match the constructor arguments without conversion.
+    Data with missing or unexpected fields, like data stored before a schema change, is not
+    mapped, so the next behavior of the pipeline can handle it.
+    """
+
+    def __init__(self):
+        self._constructors: Dict[str, Callable[..., DomainEvent]] = dict()
+
+    def add(self, event_class: type[DomainEvent]) -> None:
+        self._constructors[event_class.__name__] = event_class
+
+    def map(self, data: Dict[str, Any], event_type: str) -> Optional[DomainEvent]:
+        constructor = self._constructors.get(event_type)
+        if constructor is None:
+            return None
+
+        try:
+            return constructor(**data)
+        except TypeError:
+            return None
+
+
 class MappingPipeline:
 
     def __init__(self):
@@ -107,3 +146,22 @@ class MappingPipeline:
                 return event
 
         return None
+
+    def freeze(self) -> Callable[[Dict[str, Any], str], Optional[DomainEvent]]:
+        """Compiles the registered behaviors into a standalone mapping function.
+
+        The returned function is equivalent to `map` but skips the pipeline lookups on every call.
+        Behaviors registered after freezing the pipeline are not visible to the returned function.
+        """
+        behaviors = tuple(behavior.map for behavior in self._chain)
+
+        def map_event(data: Dict[str, Any], event_type: str) -> Optional[DomainEvent]:
+            for map_behavior in behaviors:
+                event = map_behavior(data, event_type)
+
+                if event:
+                    return event
+
+            return None
+
+        return map_event
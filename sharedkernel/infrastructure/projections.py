@@ -1,7 +1,8 @@
 from logging import Logger
 from abc import abstractmethod, ABC
+from functools import lru_cache
 from types import get_original_bases
-from typing import TypeVar, Generic, List, get_args
+from typing import Any, TypeVar, Generic, List, Callable, ClassVar, Dict, Iterable, Tuple, get_args
 from uuid import UUID
 
 from typeinspection import gethandledtypes
@@ -12,22 +13,64 @@ from sharedkernel.infrastructure.data import DataModel
 from sharedkernel.infrastructure.errors import OutOfOrderEvent
 
 TModel = TypeVar("TModel", bound=DataModel)
+TEvent = TypeVar("TEvent", bound=DomainEvent)
+
+
+def handles(event_type: type[TEvent]) -> Callable[[Callable[..., None]], Callable[..., None]]:
+    """Mark a Projection method as the handler applied for a Domain Event type.
+
+    Subclasses that override the method by name, without decorating it again,
+    keep handling the same Domain Event type with their override.
+
+    Args:
+        event_type: Domain Event class applied by the decorated method.
+
+    Returns:
+        The decorator that registers the method.
+    """
+
+    def decorator(method: Callable[..., None]) -> Callable[..., None]:
+        setattr(method, "__handles__", event_type)
+        return method
+
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def _model_type(projection_class: type) -> str:
+    """Resolve the name of the Data Model type projected by a Projection class."""
+    bases = get_original_bases(projection_class)
+    args = get_args(bases[0])
+    return args[0].__name__
 
 
 class Projection(ABC, Generic[TModel]):
+    # Event class -> name of the method applied for it, built once per Projection class.
+    # Names are resolved on the instance, so overrides in subclasses are honoured.
+    _handlers: ClassVar[Dict[type, str]] = dict()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        handlers = dict(cls._handlers)
+        for name, attribute in vars(cls).items():
+            event_type = getattr(attribute, "__handles__", None)
+            if event_type is not None:
+                handlers[event_type] = name
+        cls._handlers = handlers
 
     @property
     def model_type(self) -> str:
-        bases = get_original_bases(self.__class__)
-        args = get_args(bases[0])
-        return args[0].__name__
+        return _model_type(self.__class__)
 
     @abstractmethod
     def get_position(self, entity_id: UUID, event_type: str) -> int:
         ...
 
     def apply(self, event: DomainEvent) -> None:
-        raise UnknownEvent(self, event)
+        handler_name = self._handlers.get(type(event))
+        if handler_name is None:
+            raise UnknownEvent(self, event)
+        getattr(self, handler_name)(event)
 
     @abstractmethod
     def update_position(self, entity_id: UUID, event_type: str, position: int) -> None:
@@ -37,6 +80,12 @@ class Projection(ABC, Generic[TModel]):
 TProjection = TypeVar("TProjection", bound=Projection)
 
 
+@lru_cache(maxsize=None)
+def _handled_types(projection_class: type[Projection]) -> Tuple[str, ...]:
+    """Resolve the names of the Domain Event types marked with `handles` in a Projection class."""
+    return tuple(event_type.__name__ for event_type in projection_class._handlers)
+
+
 class Projector(Generic[TProjection]):
 
     def __init__(self, logger: Logger, projection: Projection):
@@ -45,22 +94,43 @@ class Projector(Generic[TProjection]):
 
     @property
     def handles(self) -> List[str]:
-        return gethandledtypes(type(self.projection))
+        projection_class = type(self.projection)
+        if projection_class._handlers:
+            return list(_handled_types(projection_class))
+        # Dispatch registries can still grow after the class is created, so they are read on every access.
+        return gethandledtypes(projection_class)
 
     def process(self, event: DomainEvent, position: int, entity_id: UUID) -> None:
-        current_position = self.projection.get_position(entity_id, event.qualname)
-
         event_type = event.qualname
-        if position < current_position + 1:
-            self._logger.debug(f"{event_type} position {position} has been already applied to Projection {entity_id}")
+        expected_position = self.projection.get_position(entity_id, event_type) + 1
+
+        if position < expected_position:
+            self._logger.debug("%s position %s has been already applied to Projection %s",
+                               event_type, position, entity_id)
             return
 
-        if position > current_position + 1:
-            self._logger.error(f"{event_type} position {position} is out of order in Projection {entity_id}")
+        if position > expected_position:
+            self._logger.error("%s position %s is out of order in Projection %s", event_type, position, entity_id)
             raise OutOfOrderEvent(self.projection, str(entity_id), position)
 
         self.projection.apply(event)
-        self._logger.info(f"{event_type} position {position} has been projected to record {entity_id}")
+        self._logger.info("%s position %s has been projected to record %s", event_type, position, entity_id)
 
         self.projection.update_position(entity_id, event_type, position)
-        self._logger.debug(f"{event_type} at Projection {entity_id} has been updated to position {position}")
+        self._logger.debug("%s at Projection %s has been updated to position %s", event_type, entity_id, position)
+
+    def process_many(self, events: Iterable[Tuple[DomainEvent, int, UUID]]) -> None:
+        """Process a batch of Domain Events in the order they are given.
+
+        Args:
+            events: Tuples of the Domain Event, its position and the id of the projected entity.
+
+        Returns:
+            None
+
+        Raises:
+            OutOfOrderEvent
+        """
+        process = self.process
+        for event, position, entity_id in events:
+            process(event, position, entity_id)
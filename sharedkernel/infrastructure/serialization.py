@@ -0,0 +1,11 @@
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Decodes JSON with orjson when it is installed, otherwise with the standard library.
+json_loads: Callable[[str | bytes], Any] = orjson.loads if HAS_ORJSON else json.loads
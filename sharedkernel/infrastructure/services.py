@@ -1,9 +1,10 @@
 import json
 import typing
 from datetime import datetime
+from functools import lru_cache
 from logging import Logger
 from types import get_original_bases
-from typing import List, TypeVar
+from typing import Any, Callable, ClassVar, Dict, Iterable, Optional, TypeVar
 from uuid import UUID
 
 from sharedkernel.domain.events import DomainEvent, DomainEventHandler
@@ -11,33 +12,99 @@ from sharedkernel.infrastructure.data import Event
 from sharedkernel.infrastructure.errors import MapperNotFound, UnsupportedEventHandler, UnprocessableListener
 from sharedkernel.infrastructure.mappers import MappingPipeline
 from sharedkernel.infrastructure.projections import Projector
+from sharedkernel.infrastructure.serialization import HAS_ORJSON, json_loads
+
+if HAS_ORJSON:
+    import orjson
 
 TEventHandler = TypeVar("TEventHandler", bound=DomainEventHandler)
 
 
-class UUIDEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, UUID):
-            return str(obj)
-        return json.JSONEncoder.default(self, obj)
+@lru_cache(maxsize=None)
+def _handled_event(handler_class: type) -> Optional[type]:
+    """Resolve the Domain Event class handled by a Domain Event Handler class.
+
+    Returns None when the class is not a Domain Event Handler.
+    """
+    if not issubclass(handler_class, DomainEventHandler):
+        return None
+    bases = get_original_bases(handler_class)
+    return typing.get_args(bases[0])[0]
 
 
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return json.JSONEncoder.default(self, obj)
+class _ConvertingEncoder(json.JSONEncoder):
+    """JSON Encoder that converts values using a table of converters keyed by type.
+
+    Subclasses of the types in the table are converted by the converter of their
+    closest registered base class.
+    """
 
+    converters: ClassVar[Dict[type, Callable[[Any], Any]]] = dict()
 
-class ExtraEncoder(json.JSONEncoder):
     def default(self, obj):
-        if isinstance(obj, UUID):
-            return str(obj)
+        converter = self.converters.get(type(obj))
+        if converter is None:
+            for base in type(obj).__mro__:
+                converter = self.converters.get(base)
+                if converter is not None:
+                    break
+            else:
+                return json.JSONEncoder.default(self, obj)
+        return converter(obj)
+
+
+class UUIDEncoder(_ConvertingEncoder):
+    converters = {UUID: str}
+
+
+class DateTimeEncoder(_ConvertingEncoder):
+    converters = {datetime: datetime.isoformat}
+
+
+class ExtraEncoder(_ConvertingEncoder):
+    converters = {UUID: str, datetime: datetime.isoformat}
+
+
+# Shared encoder for the standard library fallback of `dumps`, built once instead of per call.
+_COMPACT_ENCODER = ExtraEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string, including UUID and datetime values.
+
+    Uses orjson when it is installed, otherwise falls back to the standard library
+    encoder with the ExtraEncoder. Both encoders support JSON native types plus
+    UUID and datetime values; other values, like dates, dataclasses or enums, are
+    only serialized by orjson and should not be relied on. Integer, float, boolean
+    and None dictionary keys are converted to strings with either encoder; other
+    keys, like UUID or datetime, are only accepted by orjson.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        JSON formatted string.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return _COMPACT_ENCODER.encode(obj)
+
 
-        if isinstance(obj, datetime):
-            return obj.isoformat()
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON, including UUID and datetime values.
 
-        return json.JSONEncoder.default(self, obj)
+    Same as `dumps`, with the same supported types, but returns the bytes produced
+    by orjson without decoding them, ready to be written to a response or a socket.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        JSON formatted bytes.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return _COMPACT_ENCODER.encode(obj).encode()
 
 
 class EventBroker:
@@ -47,9 +114,11 @@ class EventBroker:
     Notify consumers when a new message is received.
     """
 
+    __slots__ = ("_logger", "_consumers")
+
     def __init__(self, logger: Logger):
         self._logger = logger
-        self._consumers: dict[str, list[TEventHandler]] = dict()
+        self._consumers: dict[type, tuple[Callable[[DomainEvent, int], None], ...]] = dict()
 
     def subscribe(self, event_handler: TEventHandler) -> bool:
         """Subscribe a Domain Event Handler as consumers to an Event Group.
@@ -62,20 +131,15 @@ class EventBroker:
             True if the Event Handler was successfully subscribed, otherwise False.
         """
         handler_type = type(event_handler).__name__
-        if not isinstance(event_handler, DomainEventHandler):
-            self._logger.error(f"{handler_type} is not a valid Domain Event Handler")
-            raise UnsupportedEventHandler(self, handler_type)
+        event_class = _handled_event(type(event_handler))
 
-        bases = get_original_bases(event_handler.__class__)
-        args = typing.get_args(bases[0])
-        event_type = args[0].__name__
+        if event_class is None:
+            self._logger.error("%s is not a valid Domain Event Handler", handler_type)
+            raise UnsupportedEventHandler(self, handler_type)
 
-        if event_type in self._consumers:
-            self._consumers[event_type].append(event_handler)
-        else:
-            self._consumers[event_type] = [event_handler]
+        self._consumers[event_class] = (*self._consumers.get(event_class, ()), event_handler.process)
 
-        self._logger.debug(f"{handler_type} was successfully subscribed")
+        self._logger.debug("%s was successfully subscribed", handler_type)
         return True
 
     def publish(self, event: DomainEvent, position: int) -> None:
@@ -91,17 +155,17 @@ class EventBroker:
         Returns:
            None
         """
-        event_type = type(event).__name__
+        event_class = type(event)
 
-        if event_type not in self._consumers:
-            self._logger.debug(f"No handler subscribed for {event_type} event")
-            return
+        consumer_group = self._consumers.get(event_class)
 
-        consumer_group = self._consumers[event_type]
+        if consumer_group is None:
+            self._logger.debug("No handler subscribed for %s event", event_class.__name__)
+            return
 
-        self._logger.info(f"{event_type} event was published")
-        for consumer in consumer_group:
-            consumer.process(event, position)
+        self._logger.info("%s event was published", event_class.__name__)
+        for process in consumer_group:
+            process(event, position)
 
 
 class EventDispatcher:
@@ -111,10 +175,12 @@ class EventDispatcher:
     The Dispatcher is responsible for ensuring that the Event is passed to all relevant Listeners.
     """
 
+    __slots__ = ("_logger", "_mapper", "_listeners")
+
     def __init__(self, logger: Logger, mapper: MappingPipeline):
         self._logger = logger
         self._mapper = mapper
-        self._listeners: dict[str, List[Projector]] = dict()
+        self._listeners: dict[str, tuple[Callable[[DomainEvent, int, UUID], None], ...]] = dict()
 
     def subscribe(self, listener: Projector) -> bool:
         """Subscribe an Event Handler as listener to an Event Group.
@@ -128,16 +194,13 @@ class EventDispatcher:
         handled_types = listener.handles
         listener_name = f"{type(listener).__name__} of {type(listener.projection).__name__}"
         if not handled_types:
-            self._logger.error(f"Listener {listener_name} does not handle any type")
+            self._logger.error("Listener %s does not handle any type", listener_name)
             raise UnprocessableListener(self, listener_name)
 
         for event_type in handled_types:
-            if event_type in self._listeners:
-                self._listeners[event_type].append(listener)
-            else:
-                self._listeners[event_type] = [listener]
+            self._listeners[event_type] = (*self._listeners.get(event_type, ()), listener.process)
 
-        self._logger.debug(f"{listener_name} was successfully subscribed")
+        self._logger.debug("%s was successfully subscribed", listener_name)
         return True
 
     def dispatch(self, event: Event) -> None:
@@ -154,21 +217,47 @@ class EventDispatcher:
         Raises:
             MapperNotFound
         """
-        event_type = event.event_type
+        self.dispatch_many((event,))
 
-        if event_type not in self._listeners:
-            self._logger.debug(f"No listener subscribed for {event_type} event")
-            return
+    def dispatch_many(self, events: Iterable[Event]) -> None:
+        """Publish a batch of Events to their respective Event Groups.
+
+        Events are dispatched one after the other, in the order they are given,
+        so the positions of each stream keep their sequence.
+
+        Args:
+           events: Events to dispatch.
+
+        Returns:
+           None
+
+        Raises:
+            MapperNotFound
+        """
+        listeners = self._listeners
+        map_event = self._mapper.map
+        logger = self._logger
+
+        for event in events:
+            event_type = event.event_type
+
+            listener_group = listeners.get(event_type)
 
-        event_data = json.loads(event.data)
+            if listener_group is None:
+                logger.debug("No listener subscribed for %s event", event_type)
+                continue
 
-        domain_event = self._mapper.map(event_data, event_type)
-        if not domain_event:
-            self._logger.error(f"MappingPipeline does not have any event mapper for {event_type}")
-            raise MapperNotFound(self, event_type)
+            event_data = event.data
+            if not isinstance(event_data, dict):
+                event_data = json_loads(event_data)
 
-        listener_group = self._listeners[event_type]
+            domain_event = map_event(event_data, event_type)
+            if not domain_event:
+                logger.error("MappingPipeline does not have any event mapper for %s", event_type)
+                raise MapperNotFound(self, event_type)
 
-        self._logger.info(f"{event_type} event dispatched to all listeners")
-        for listener in listener_group:
-            listener.process(domain_event, event.position, event.stream_id)
+            logger.info("%s event dispatched to all listeners", event_type)
+            position = event.position
+            stream_id = event.stream_id
+            for process in listener_group:
+                process(domain_event, position, stream_id)
@@ -1,4 +1,3 @@
-import json
 from dataclasses import dataclass
 
 from sharedkernel.api.contracts import ErrorResponse, ProblemDetail, DomainErrorResponse
@@ -6,6 +5,8 @@ from sharedkernel.domain.errors import Error, UnknownEvent
 from sharedkernel.domain.events import DomainEvent
 from sharedkernel.domain.models import EntityID, Aggregate
 
+PROBLEM_DETAIL_JSON = '{"loc":["Users.CreateUser"],"msg":"First name is null or empty.","type":"FirstName.NullOrEmpty"}'
+
 
 @dataclass(frozen=True)
 class UserID(EntityID):
@@ -19,7 +20,7 @@ class User(Aggregate[UserID]):
         self.name: str = name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountOpened(DomainEvent):
     event_id: str
     message: str
@@ -27,11 +28,7 @@ class AccountOpened(DomainEvent):
 
 def test_problem_detail_is_parsed_to_json():
     # Arrange
-    error_dict = {'loc': ["Users.CreateUser"],
-                  'msg': "First name is null or empty.",
-                  'type': "FirstName.NullOrEmpty", }
-
-    expected = json.dumps(error_dict, separators=(',', ':'))
+    expected = PROBLEM_DETAIL_JSON
 
     # Act
     result = ProblemDetail(loc=["Users.CreateUser"],
@@ -42,6 +39,19 @@ def test_problem_detail_is_parsed_to_json():
     assert result.model_dump_json() == expected
 
 
+def test_problem_detail_is_serialized_to_json_bytes():
+    # Arrange
+    expected = PROBLEM_DETAIL_JSON.encode()
+
+    # Act
+    result = ProblemDetail(loc=["Users.CreateUser"],
+                           msg="First name is null or empty.",
+                           type="FirstName.NullOrEmpty", )
+
+    # Assert
+    assert result.to_json_bytes() == expected
+
+
 def test_problem_detail_is_constructed_with_error_response():
     # Arrange
     expected = ProblemDetail(loc=["Users.CreateUser"],
@@ -58,7 +68,7 @@ def test_problem_detail_is_constructed_with_error_response():
     result = ErrorResponse(error=null_or_empty)
 
     # Assert
-    assert result.model_dump_json() == expected.model_dump_json()
+    assert result.model_dump() == expected.model_dump()
 
 
 def test_problem_detail_is_constructed_with_domain_error():
@@ -79,4 +89,64 @@ def test_problem_detail_is_constructed_with_domain_error():
     result = DomainErrorResponse(error=unknown_event)
 
     # Assert
-    assert result.model_dump_json() == expected.model_dump_json()
+    assert result.model_dump() == expected.model_dump()
+
+
+def test_problem_detail_cached_json_bytes_return_serialized_problem():
+    # Arrange
+    expected = PROBLEM_DETAIL_JSON.encode()
+
+    # Act
+    result = ProblemDetail.cached_json_bytes(("Users.CreateUser",),
+                                             "First name is null or empty.",
+                                             "FirstName.NullOrEmpty", )
+
+    # Assert
+    assert result == expected
+
+
+def test_problem_detail_cached_json_bytes_with_list_location_return_serialized_problem():
+    # Arrange
+    expected = PROBLEM_DETAIL_JSON.encode()
+
+    # Act
+    result = ProblemDetail.cached_json_bytes(["Users.CreateUser"],
+                                             msg="First name is null or empty.",
+                                             problem_type="FirstName.NullOrEmpty", )
+
+    # Assert
+    assert result == expected
+
+
+def test_problem_detail_is_equal_to_problem_detail_with_same_details():
+    # Arrange
+    expected = ProblemDetail(loc=["Users.CreateUser"],
+                             msg="First name is null or empty.",
+                             type="FirstName.NullOrEmpty", )
+
+    # Act
+    result = ProblemDetail(loc=["Users.CreateUser"],
+                           msg="First name is null or empty.",
+                           type="FirstName.NullOrEmpty", )
+
+    # Assert
+    assert result == expected
+
+
+def test_error_response_is_not_equal_to_problem_detail_with_same_details():
+    # Arrange
+    problem_detail = ProblemDetail(loc=["Users.CreateUser"],
+                                   msg="First name is null or empty.",
+                                   type="FirstName.NullOrEmpty", )
+
+    null_or_empty = Error(
+        message="First name is null or empty.",
+        code="FirstName.NullOrEmpty",
+        reason="User 'first name' should not be null nor empty.",
+        domain="Users.CreateUser", )
+
+    # Act
+    result = ErrorResponse(error=null_or_empty)
+
+    # Assert
+    assert result != problem_detail
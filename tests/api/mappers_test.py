@@ -10,6 +10,8 @@ from sharedkernel.api.mappers import RequestMapper
 from sharedkernel.api.mappers import RequestMappersChain
 from sharedkernel.application.commands import Command
 
+USER_ID = UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c')
+
 
 class RegisterUserRequest(Request):
     user_id: str
@@ -22,6 +24,10 @@ class LogInUserRequest(Request):
     email: str
 
 
+class RegisterAdminRequest(RegisterUserRequest):
+    ...
+
+
 @dataclass(frozen=True)
 class LogInUser(Command):
     name: str
@@ -60,10 +66,23 @@ class LogInUserRequestMapper(RequestMapper[LogInUserRequest]):
         )
 
 
+class RegisterUserRequestsMapper(RequestMapper[RegisterUserRequest]):
+
+    def map(self, request: RegisterUserRequest, **query_params) -> Optional[RegisterUser]:
+        if not isinstance(request, RegisterUserRequest):
+            return self.map_next(request, **query_params)
+
+        return RegisterUser(
+            user_id=UUID(request.user_id),
+            name=request.name,
+            slug=request.slug,
+        )
+
+
 def test_mapper_return_command_with_valid_request():
     # Arrange
     expected = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="John Doe Smith",
         slug="john-doe-smith",
     )
@@ -103,7 +122,7 @@ def test_mapper_return_none_with_unknown_request():
 def test_mapper_chain_return_command_with_valid_data():
     # Arrange
     expected = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="John Doe Smith",
         slug="john-doe-smith",
     )
@@ -131,7 +150,7 @@ def test_mapper_chain_return_command_with_valid_data():
 def test_mapper_chain_return_command_when_several_mapper_added():
     # Arrange
     expected = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="John Doe Smith",
         slug="john-doe-smith",
     )
@@ -201,3 +220,58 @@ def test_mapper_chain_raise_error_when_no_mapper_found():
 
     # Assert
     assert str(error.value) == expected
+
+
+def test_mapper_chain_links_mappers_to_delegate_requests():
+    # Arrange
+    expected = RegisterUser(
+        user_id=USER_ID,
+        name="John Doe Smith",
+        slug="john-doe-smith",
+    )
+
+    request = RegisterUserRequest(
+        user_id='018f9284-769b-726d-b3bf-3885bf2ddd3c',
+        name="John Doe Smith",
+        slug="john-doe-smith",
+    )
+
+    register_mapper = RegisterUserRequestMapper()
+    log_in_mapper = LogInUserRequestMapper()
+
+    chain = RequestMappersChain()
+    chain.add(register_mapper)
+    chain.add(log_in_mapper)
+
+    # Act
+    # noinspection PyTypeChecker
+    result = log_in_mapper.map(request)
+
+    # Assert
+    assert result == expected
+
+
+def test_mapper_chain_return_command_mapped_by_delegating_mapper():
+    # Arrange
+    expected = RegisterUser(
+        user_id=USER_ID,
+        name="John Doe Smith",
+        slug="john-doe-smith",
+    )
+
+    request = RegisterAdminRequest(
+        user_id='018f9284-769b-726d-b3bf-3885bf2ddd3c',
+        name="John Doe Smith",
+        slug="john-doe-smith",
+    )
+
+    chain = RequestMappersChain()
+    chain.add(RegisterUserRequestsMapper())
+    chain.add(LogInUserRequestMapper())
+
+    # Act
+    # noinspection PyTypeChecker
+    result = chain.map(request)
+
+    # Assert
+    assert result == expected
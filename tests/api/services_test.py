@@ -1,4 +1,5 @@
 import time
+from types import MappingProxyType
 from uuid import UUID
 
 from pytest import approx
@@ -6,22 +7,26 @@ from pytest import approx
 from sharedkernel.api.services import AckResponseModel, ElapsedTime
 from sharedkernel.application.commands import Acknowledgement, CommandStatus
 
+USER_ID = UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c')
+
+EXPECTED_ACK = MappingProxyType({
+    "status": "executed",
+    "data": MappingProxyType({
+        "action": "RegisterUser",
+        "entityId": USER_ID,
+        "version": 1
+    })
+})
+
 
 def test_ack_response_model_from_acknowledgement():
     # Arrange
-    expected = {
-        "status": "executed",
-        "data": {
-            "action": "RegisterUser",
-            "entityId": UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
-            "version": 1
-        }
-    }
+    expected = EXPECTED_ACK
 
     ack = Acknowledgement(
         status=CommandStatus.EXECUTED,
         action="RegisterUser",
-        entity_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        entity_id=USER_ID,
         version=1,
     )
 
@@ -32,6 +37,25 @@ def test_ack_response_model_from_acknowledgement():
     assert result.model_dump(by_alias=True) == expected
 
 
+def test_ack_response_model_to_json_bytes():
+    # Arrange
+    expected = (b'{"status":"executed","data":{"action":"RegisterUser",'
+                b'"entityId":"018f9284-769b-726d-b3bf-3885bf2ddd3c","version":1}}')
+
+    ack = Acknowledgement(
+        status=CommandStatus.EXECUTED,
+        action="RegisterUser",
+        entity_id=USER_ID,
+        version=1,
+    )
+
+    # Act
+    result = AckResponseModel.to_json_bytes(ack)
+
+    # Assert
+    assert result == expected
+
+
 def test_elapsed_time_return_valid_milliseconds():
     # Arrange
     start = time.time()
@@ -49,3 +73,22 @@ def test_elapsed_time_return_valid_milliseconds():
 
     # Assert
     assert result == approx(expected, 1.0e+01)
+
+
+def test_elapsed_time_from_nanoseconds_return_valid_milliseconds():
+    # Arrange
+    start = time.perf_counter_ns()
+
+    time.sleep(0.1)
+
+    end = time.perf_counter_ns()
+
+    expected = 100
+
+    # Act
+    elapsed = ElapsedTime.from_delta_ns(start, end)
+
+    result = elapsed.milliseconds
+
+    # Assert
+    assert result == approx(expected, 1.0e+01)
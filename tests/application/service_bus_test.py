@@ -13,6 +13,9 @@ from sharedkernel.domain.data import ReadModel, ReadModelList
 from sharedkernel.domain.errors import Error, DomainError
 from sharedkernel.domain.events import DomainEvent, DomainEventHandler
 
+USER_ID = UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c')
+UNKNOWN_USER_ID = UUID('018f928b-5546-77e6-badf-3155de144924')
+
 
 class DuplicateName(DomainError):
     def __init__(self, aggregate: object, name: str):
@@ -20,21 +23,21 @@ class DuplicateName(DomainError):
         super().__init__(entity=aggregate, message=message)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserModel(ReadModel):
     user_id: UUID
     name: str
     slug: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterUser(Command):
     user_id: UUID
     name: str
     slug: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetUserByID(Query):
     user_id: UUID
 
@@ -77,11 +80,11 @@ class RegisterUserCommandHandler(CommandHandler[RegisterUser]):
         if command.name == "John Doe":
             raise DuplicateName(self, command.name)
 
-        if command.user_id == UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'):
+        if command.user_id == USER_ID:
             ack = Acknowledgement(
                 status=CommandStatus.RECEIVED,
                 action="RegisterUser",
-                entity_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+                entity_id=USER_ID,
                 version=1, )
             return Ok(ack)
         else:
@@ -92,9 +95,9 @@ class RegisterUserCommandHandler(CommandHandler[RegisterUser]):
 class GetUserByIDQueryHandler(QueryHandler[GetUserByID]):
 
     def execute(self, command: GetUserByID) -> Result[ReadModel, Error]:
-        if command.user_id == UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'):
+        if command.user_id == USER_ID:
             user = UserModel(
-                user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+                user_id=USER_ID,
                 name="John Doe Smith",
                 slug="john-doe-smith",
             )
@@ -108,7 +111,7 @@ class GetAllUsersQueryHandler(QueryHandler[GetAllUsers]):
 
     def execute(self, command: GetAllUsers) -> Result[ReadModelList, Error]:
         all_user = [UserModel(
-            user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+            user_id=USER_ID,
             name="John Doe Smith",
             slug="john-doe-smith",
         )]
@@ -123,21 +126,24 @@ class GetAllUsersQueryHandler(QueryHandler[GetAllUsers]):
         return Ok(user_list)
 
 
+def name_is_null_or_empty(request: RegisterUser) -> bool:
+    return request.name is None or request.name.strip() == ""
+
+
 class RegisterOfficialValidator(Validator[RegisterUser]):
+    CHECKS = (
+        (name_is_null_or_empty, name_null_or_empty_error),
+    )
 
     def validate(self, request: RegisterUser) -> ValidationResult:
-        errors = []
-
-        if request.name is None or request.name.strip() == "":
-            name_null_or_empty = name_null_or_empty_error()
-            errors.append(name_null_or_empty)
+        errors = [error() for check, error in self.CHECKS if check(request)]
         if errors:
             return ValidationResult.with_errors(errors=errors)
         else:
             return ValidationResult.success()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserRegistered(DomainEvent):
     event_id: str
     message: str
@@ -223,7 +229,7 @@ def test_pre_process_request_with_no_validator_return_valid_result(fake_logger):
     # Arrange
     bus = ServiceBus(fake_logger)
     command = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="John Doe Smith",
         slug="john-doe-smith",
     )
@@ -242,7 +248,7 @@ def test_pre_process_valid_request_return_valid_result(fake_logger):
     bus.register(validator)
 
     command = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="John Doe Smith",
         slug="john-doe-smith",
     )
@@ -261,7 +267,7 @@ def test_pre_process_invalid_request_return_validation_errors(fake_logger):
     bus.register(validator)
 
     command = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="",
         slug="john-doe-smith",
     )
@@ -278,7 +284,7 @@ def test_process_command_with_no_handler_return_rejection(fake_logger):
     bus = ServiceBus(fake_logger)
 
     command = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="John Doe Smith",
         slug="john-doe-smith",
     )
@@ -299,7 +305,7 @@ def test_process_valid_command_return_command_acknowledgment(fake_logger):
     bus.register(handler)
 
     command = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="John Doe Smith",
         slug="john-doe-smith",
     )
@@ -319,7 +325,7 @@ def test_process_invalid_command_return_rejection(fake_logger):
     bus.register(handler)
 
     command = RegisterUser(
-        user_id=UUID('018f928b-5546-77e6-badf-3155de144924'),
+        user_id=UNKNOWN_USER_ID,
         name="John Doe Smith",
         slug="john-doe-smith",
     )
@@ -333,7 +339,7 @@ def test_process_invalid_command_return_rejection(fake_logger):
 
 def test_process_query_with_handler_return_rejection(fake_logger):
     # Arrange
-    user_id = UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c')
+    user_id = USER_ID
 
     bus = ServiceBus(fake_logger)
 
@@ -350,7 +356,7 @@ def test_process_query_with_handler_return_rejection(fake_logger):
 
 def test_process_valid_query_return_read_model(fake_logger):
     # Arrange
-    user_id = UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c')
+    user_id = USER_ID
 
     bus = ServiceBus(fake_logger)
     handler = GetUserByIDQueryHandler()
@@ -367,7 +373,7 @@ def test_process_valid_query_return_read_model(fake_logger):
 
 def test_process_invalid_query_return_rejection(fake_logger):
     # Arrange
-    user_id = UUID('018f928b-5546-77e6-badf-3155de144924')
+    user_id = UNKNOWN_USER_ID
 
     bus = ServiceBus(fake_logger)
     handler = GetUserByIDQueryHandler()
@@ -391,7 +397,7 @@ def test_send_valid_command_return_command_acknowledgment(fake_logger):
     bus.register(handler)
 
     command = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="John Doe Smith",
         slug="john-doe-smith",
     )
@@ -405,7 +411,7 @@ def test_send_valid_command_return_command_acknowledgment(fake_logger):
 
 def test_send_valid_query_return_read_model(fake_logger):
     # Arrange
-    user_id = UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c')
+    user_id = USER_ID
 
     bus = ServiceBus(fake_logger)
     handler = GetUserByIDQueryHandler()
@@ -435,6 +441,31 @@ def test_send_valid_query_return_read_model_list(fake_logger):
     assert result.total == 1
 
 
+def test_send_many_requests_return_responses_in_order(fake_logger):
+    # Arrange
+    user_id = USER_ID
+
+    bus = ServiceBus(fake_logger)
+    bus.register(RegisterUserCommandHandler())
+    bus.register(GetUserByIDQueryHandler())
+
+    command = RegisterUser(
+        user_id=user_id,
+        name="John Doe Smith",
+        slug="john-doe-smith",
+    )
+    query = GetUserByID(user_id=user_id)
+
+    # Act
+    result = bus.send_many([command, query, command])
+
+    # Assert
+    assert len(result) == 3
+    assert result[0].status is CommandStatus.RECEIVED
+    assert result[1].user_id == user_id
+    assert result[2].status is CommandStatus.RECEIVED
+
+
 def test_send_event_as_request_return_rejection(fake_logger):
     # Arrange
     user_registered = UserRegistered(
@@ -459,7 +490,7 @@ def test_send_invalid_request_return_rejection(fake_logger):
     bus.register(validator)
 
     command = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="",
         slug="john-doe-smith",
     )
@@ -478,7 +509,7 @@ def test_send_conflicting_command_return_rejection(fake_logger):
     bus.register(handler)
 
     command = RegisterUser(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         name="John Doe",
         slug="john-doe-smith",
     )
@@ -1,7 +1,6 @@
 from typing import Protocol
 
 import pytest
-import sys
 
 
 class LoggerProtocol(Protocol):
@@ -40,18 +39,6 @@ class TestLogger(LoggerProtocol):
         pass
 
 
-@pytest.fixture
-def capture_stdout(monkeypatch):
-    buffer = {"console": "", "write_calls": 0}
-
-    def fake_write(s):
-        buffer["console"] += s
-        buffer["write_calls"] += 1
-
-    monkeypatch.setattr(sys.stdout, 'write', fake_write)
-    return buffer
-
-
 @pytest.fixture
 def fake_logger():
     return TestLogger()
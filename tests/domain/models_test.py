@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from functools import singledispatchmethod
 
 import pytest
 
@@ -7,6 +6,8 @@ from sharedkernel.domain.errors import UnknownEvent
 from sharedkernel.domain.events import DomainEvent
 from sharedkernel.domain.models import ValueObject, EntityID, Entity, Aggregate
 
+UNKNOWN_EVENT_MESSAGE = "Event 'UserLoggedIn' cannot be applied to 'User'"
+
 
 @dataclass(frozen=True)
 class Money(ValueObject):
@@ -79,18 +80,26 @@ class User(Aggregate[UserID]):
 
         self._raise_event(name_updated)
 
-    @singledispatchmethod
     def _apply(self, event: DomainEvent) -> None:
-        super()._apply(event)
+        handler = self._HANDLERS.get(type(event), Aggregate._apply)
+        handler(self, event)
 
-    @_apply.register
-    def _when(self, event: UserRegistered) -> None:
+    def _when_registered(self, event: UserRegistered) -> None:
         self.name = event.name
 
-    @_apply.register
-    def _when(self, event: UserNameUpdated) -> None:
+    def _when_name_updated(self, event: UserNameUpdated) -> None:
         self.name = event.new_name
 
+    _HANDLERS = {
+        UserRegistered: _when_registered,
+        UserNameUpdated: _when_name_updated,
+    }
+
+
+@pytest.fixture(scope="module")
+def dr_country():
+    return Country(country_id=CountryID("DO"), name="Dominican Republic")
+
 
 def test_value_objects_with_same_value_are_equal():
     # Arrange
@@ -127,94 +136,78 @@ def test_entities_with_same_id_are_equal():
     assert country1 == country2
 
 
-def test_entity_equal_to_value_object_is_false():
+def test_entity_equal_to_value_object_is_false(dr_country):
     # Arrange
-    country_id1 = CountryID("DO")
     country_id2 = CountryID("DR")
 
     # Act
-    country1 = Country(country_id=country_id1, name="Dominican Republic")
+    result = dr_country == country_id2
 
     # Assert
-    assert (country1 == country_id2) is False
+    assert result is False
 
 
-def test_entities_with_different_id_are_not_equal():
+def test_entities_with_different_id_are_not_equal(dr_country):
     # Arrange
-    country_id1 = CountryID("DO")
     country_id2 = CountryID("DR")
 
     # Act
-    country1 = Country(country_id=country_id1, name="Dominican Republic")
-
     country2 = Country(country_id=country_id2, name="Dominican Republic")
 
     # Assert
-    assert country1 != country2
+    assert dr_country != country2
 
 
-def test_entity_not_equal_to_value_object_is_true():
+def test_entity_not_equal_to_value_object_is_true(dr_country):
     # Arrange
-    country_id1 = CountryID("DO")
     country_id2 = CountryID("DR")
 
     # Act
-    country1 = Country(country_id=country_id1, name="Dominican Republic")
+    result = dr_country != country_id2
 
     # Assert
-    assert country1 != country_id2
+    assert result is True
 
 
-def test_entity_repr():
+def test_entity_repr(dr_country):
     # Arrange
-    country_id = CountryID("DO")
-
-    dr = Country(country_id=country_id, name="Dominican Republic")
-
     expected = "Country(id=CountryID(value='DO'))"
 
     # Act
-    result = repr(dr)
+    result = repr(dr_country)
 
     # Assert
     assert result == expected
 
 
-def test_entity_is_hashable():
-    # Arrange
-    country_id = CountryID("DO")
-
-    dr = Country(country_id=country_id, name="Dominican Republic")
-
+def test_entity_is_hashable(dr_country):
     # Act
-    result = {dr: True}
+    result = {dr_country: True}
 
     # Assert
-    assert result[dr]
+    assert result[dr_country]
 
 
-def test_entity_qualname():
+def test_entity_qualname(dr_country):
     # Arrange
-    country_id = CountryID("DO")
     expected = "Country"
 
     # Act
-    dr = Country(country_id=country_id, name="Dominican Republic")
+    result = dr_country.qualname
 
     # Assert
-    assert dr.qualname == expected
+    assert result == expected
 
 
-def test_entity_full_qualname():
+def test_entity_full_qualname(dr_country):
     # Arrange
-    country_id = CountryID("DO")
     expected = "tests.domain.models_test.Country"
 
     # Act
-    dr = Country(country_id=country_id, name="Dominican Republic")
+    result = dr_country.full_qualname
 
     # Assert
-    assert dr.full_qualname == expected
+    assert result == expected
 
 
 def test_aggregates_with_same_id_are_equal():
@@ -302,7 +295,7 @@ def test_aggregates_unknown_events_raise_error():
     user_id = UserID(101)
     events = (UserLoggedIn(user_id=101, name="John Doe"),)
 
-    expected = "Event 'UserLoggedIn' cannot be applied to 'User'"
+    expected = UNKNOWN_EVENT_MESSAGE
 
     # Act
     with pytest.raises(UnknownEvent) as error:
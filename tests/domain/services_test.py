@@ -1,13 +1,16 @@
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, ClassVar
 
 import pytest
 
 from sharedkernel.domain.models import ValueObject
 from sharedkernel.domain.services import Guard, Detect
 
+INVALID_CHARACTER_MESSAGE = "Text contains an invalid character"
+INVALID_WORD_MESSAGE = "Text contains an invalid word"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Email(ValueObject):
     value: str
 
@@ -17,7 +20,7 @@ class Email(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MiddleName(ValueObject):
     value: str
 
@@ -27,9 +30,9 @@ class MiddleName(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LastName(ValueObject):
-    MAXIMUM_LENGTH: int = field(default=25, init=False)
+    MAXIMUM_LENGTH: ClassVar[int] = 25
     value: str
 
     @classmethod
@@ -38,9 +41,9 @@ class LastName(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Age(ValueObject):
-    MAXIMUM_AGE: int = field(default=120, init=False)
+    MAXIMUM_AGE: ClassVar[int] = 120
     years: float
 
     @classmethod
@@ -50,7 +53,7 @@ class Age(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Username(ValueObject):
     value: str
 
@@ -58,15 +61,14 @@ class Username(ValueObject):
     def create(cls, value: str):
         Guard.is_not_null(value)
         Guard.is_not_equal(value.lower(), "root")
-        Detect.special_character(value)
-        Detect.reserved_word(value)
+        Detect.sql_injection(value)
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Password(ValueObject):
-    MAXIMUM_LENGTH: int = field(default=12, init=False)
-    MINIMUM_LENGTH: int = field(default=8, init=False)
+    MAXIMUM_LENGTH: ClassVar[int] = 12
+    MINIMUM_LENGTH: ClassVar[int] = 8
     value: str
 
     @classmethod
@@ -77,7 +79,7 @@ class Password(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Comment(ValueObject):
     value: str
 
@@ -87,7 +89,7 @@ class Comment(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LastUpdated(ValueObject):
     value: Any
 
@@ -97,7 +99,7 @@ class LastUpdated(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Directory(ValueObject):
     value: str
 
@@ -107,9 +109,9 @@ class Directory(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CountryID(ValueObject):
-    SIZE: int = field(default=2, init=False)
+    SIZE: ClassVar[int] = 2
     value: str
 
     @classmethod
@@ -118,9 +120,9 @@ class CountryID(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Capacity(ValueObject):
-    MAXIMUM: int = field(default=1000, init=False)
+    MAXIMUM: ClassVar[int] = 1000
     value: int
 
     @classmethod
@@ -130,9 +132,9 @@ class Capacity(ValueObject):
         return cls(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Amount(ValueObject):
-    MAXIMUM: int = field(default=100, init=False)
+    MAXIMUM: ClassVar[int] = 100
     years: float
 
     @classmethod
@@ -164,62 +166,35 @@ def test_object_with_not_empty_or_null_value_is_created():
     assert result.value == email_value
 
 
-def test_object_with_not_null_but_empty_value_raise_an_error():
-    # Arrange
-    empty_email = ""
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Email.create(empty_email)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Email cannot be null nor empty"
-
-
-def test_object_with_null_value_but_not_empty_raise_an_error():
-    # Arrange
-    null_email = None
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        # noinspection PyTypeChecker
-        _ = Email.create(null_email)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Email cannot be null nor empty"
-
-
-def test_object_with_null_value_raise_an_error():
-    # Arrange
-    null_username = None
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        # noinspection PyTypeChecker
-        _ = Username.create(null_username)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Username cannot be null"
-
-
-def test_object_with_empty_value_raise_an_error():
-    # Arrange
-    comment = ""
-
+@pytest.mark.parametrize("factory, value, message", [
+    pytest.param(Email, "", "Email cannot be null nor empty", id="not_null_but_empty_value"),
+    pytest.param(Email, None, "Email cannot be null nor empty", id="null_value_but_not_empty"),
+    pytest.param(Username, None, "Username cannot be null", id="null_value"),
+    pytest.param(Comment, "", "Comment cannot be empty", id="empty_value"),
+    pytest.param(LastUpdated, "2024-10-31T01:30:00.000-04:00", "LastUpdated must be null", id="not_null_value"),
+    pytest.param(Directory, "/usr/local/lib/python3", "Directory must be empty", id="not_empty_value"),
+    pytest.param(LastName,
+                 "Diego José Francisco de Paula Juan Nepomuceno Cipriano de la Santísima Trinidad Ruiz Picasso",
+                 "LastName must be 25 characters or less",
+                 id="incorrect_value_length"),
+    pytest.param(Age, -3, "Age must be greater than or equal to 0", id="value_under_range"),
+    pytest.param(Age, 200, "Age must be less than 120", id="value_over_range"),
+    pytest.param(Username, "root", "Username should not be equal to root", id="reserved_name"),
+    pytest.param(Password, "12345", "Password must be 8 characters or more", id="short_value"),
+    pytest.param(CountryID, "USA", "CountryID should be equal to 2", id="not_equal_value"),
+    pytest.param(Capacity, 1500, "Capacity must be less than 1000", id="not_lower_value"),
+    pytest.param(Amount, -3, "Amount must be greater than 0", id="value_less"),
+    pytest.param(Amount, 110, "Amount must be less than or equal to 100", id="value_greater"),
+])
+def test_object_with_invalid_value_raise_an_error(factory, value, message):
     # Act
     with pytest.raises(ValueError) as error:
-        _ = Comment.create(comment)
+        _ = factory.create(value)
 
     error_message = str(error.value)
 
     # Assert
-    assert error_message == "Comment cannot be empty"
+    assert error_message == message
 
 
 def test_object_with_not_empty_value_is_created():
@@ -244,20 +219,6 @@ def test_object_with_null_value_is_created():
     assert result.value is None
 
 
-def test_object_with_not_null_value_raise_an_error():
-    # Arrange
-    null_date = "2024-10-31T01:30:00.000-04:00"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = LastUpdated.create(null_date)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "LastUpdated must be null"
-
-
 def test_object_with_empty_value_is_created():
     # Arrange
     path = ""
@@ -269,20 +230,6 @@ def test_object_with_empty_value_is_created():
     assert result.value == ""
 
 
-def test_object_with_not_empty_value_raise_an_error():
-    # Arrange
-    path = "/usr/local/lib/python3"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Directory.create(path)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Directory must be empty"
-
-
 def test_object_with_appropriate_value_length_is_created():
     # Arrange
     last_name_value = "Smith"
@@ -294,20 +241,6 @@ def test_object_with_appropriate_value_length_is_created():
     assert result.value == last_name_value
 
 
-def test_object_with_incorrect_value_length_raise_error():
-    # Arrange
-    last_name_value = "Diego José Francisco de Paula Juan Nepomuceno Cipriano de la Santísima Trinidad Ruiz Picasso"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = LastName.create(last_name_value)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "LastName must be 25 characters or less"
-
-
 def test_object_with_value_within_range_is_created():
     # Arrange
     twenty_five = 25
@@ -319,34 +252,6 @@ def test_object_with_value_within_range_is_created():
     assert result.years == twenty_five
 
 
-def test_object_with_value_under_range_raise_error():
-    # Arrange
-    negative_age = -3
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Age.create(negative_age)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Age must be greater than or equal to 0"
-
-
-def test_object_with_value_over_range_raise_error():
-    # Arrange
-    two_hundreds = 200
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Age.create(two_hundreds)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Age must be less than 120"
-
-
 def test_object_with_sanitized_text_is_created():
     # Arrange
     username_value = "johndoe"
@@ -358,396 +263,71 @@ def test_object_with_sanitized_text_is_created():
     assert result.value == username_value
 
 
-def test_object_with_reserved_name_raise_an_error():
-    # Arrange
-    user = "root"
-
+@pytest.mark.parametrize("text", [
+    pytest.param("1 = 1", id="equal_sign"),
+    pytest.param('"USERS"', id="quotes"),
+    pytest.param("0 < 1", id="less_than_sign"),
+    pytest.param("1 > 0", id="greater_than_sign"),
+    pytest.param("TRUE;", id="semi_colon"),
+    pytest.param("#TempTables", id="number_sign"),
+    pytest.param("AS $$ DECLARE", id="money_sign"),
+    pytest.param("%admin%", id="percentage_sign"),
+    pytest.param("5 ^ 3", id="caret_sign"),
+    pytest.param("&user", id="ampersand_sign"),
+    pytest.param("*", id="asterisk_sign"),
+    pytest.param("(user", id="open_parenthesis"),
+    pytest.param("user)", id="close_parenthesis"),
+    pytest.param("@@CHARACTER_SET_CLIENT", id="system_variable"),
+    pytest.param(":name || :password", id="concat_operator"),
+    pytest.param("true --", id="comment_sign"),
+])
+def test_text_with_special_character_raise_an_error(text):
     # Act
     with pytest.raises(ValueError) as error:
-        _ = Username.create(user)
+        _ = Username.create(text)
 
     error_message = str(error.value)
 
     # Assert
-    assert error_message == "Username should not be equal to root"
-
+    assert error_message == INVALID_CHARACTER_MESSAGE
 
-def test_text_with_equal_sign_raise_an_error():
-    # Arrange
-    special_text = "1 = 1"
 
+@pytest.mark.parametrize("text", [
+    pytest.param("ALTER VIEW users", id="alter_reserved_word"),
+    pytest.param("CREATE VIEW users", id="create_reserved_word"),
+    pytest.param("DELETE VIEW users", id="delete_reserved_word"),
+    pytest.param("DROP VIEW users", id="drop_reserved_word"),
+    pytest.param("EXECUTE function get_user", id="execute_reserved_word"),
+    pytest.param("INSERT INTO", id="insert_reserved_word"),
+    pytest.param("MERGE VIEW", id="merge_reserved_word"),
+    pytest.param("SELECT name", id="select_reserved_word"),
+    pytest.param("UPDATE VIEW", id="update_reserved_word"),
+    pytest.param("true OR false", id="or_reserved_word"),
+    pytest.param("FLUSH TABLE users", id="table_reserved_word"),
+])
+def test_text_with_reserved_word_raise_an_error(text):
     # Act
     with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
+        _ = Username.create(text)
 
     error_message = str(error.value)
 
     # Assert
-    assert error_message == "Text contains an invalid character"
+    assert error_message == INVALID_WORD_MESSAGE
 
 
-def test_text_with_quotes_raise_an_error():
+def test_text_with_special_character_and_reserved_word_raise_character_error():
     # Arrange
-    special_text = '"USERS"'
+    text = "DROP TABLE users;"
 
     # Act
     with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
+        Detect.sql_injection(text)
 
     error_message = str(error.value)
 
     # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_less_than_sign_raise_an_error():
-    # Arrange
-    special_text = "0 < 1"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_greater_than_sign_raise_an_error():
-    # Arrange
-    special_text = "1 > 0"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_semi_colon_raise_an_error():
-    # Arrange
-    special_text = "TRUE;"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_number_sign_raise_an_error():
-    # Arrange
-    special_text = "#TempTables"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_money_sign_raise_an_error():
-    # Arrange
-    special_text = "AS $$ DECLARE"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_percentage_sign_raise_an_error():
-    # Arrange
-    special_text = "%admin%"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_caret_sign_raise_an_error():
-    # Arrange
-    special_text = "5 ^ 3"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_ampersand_sign_raise_an_error():
-    # Arrange
-    special_text = "&user"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_asterisk_sign_raise_an_error():
-    # Arrange
-    special_text = "*"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_open_parenthesis_raise_an_error():
-    # Arrange
-    special_text = "(user"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_close_parenthesis_raise_an_error():
-    # Arrange
-    special_text = "user)"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_system_variable_raise_an_error():
-    # Arrange
-    special_text = "@@CHARACTER_SET_CLIENT"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_concat_operator_raise_an_error():
-    # Arrange
-    special_text = ":name || :password"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_comment_sign_raise_an_error():
-    # Arrange
-    special_text = "true --"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid character"
-
-
-def test_text_with_alter_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "ALTER VIEW users"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_create_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "CREATE VIEW users"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_delete_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "DELETE VIEW users"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_drop_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "DROP VIEW users"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_execute_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "EXECUTE function get_user"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_insert_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "INSERT INTO"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_merge_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "MERGE VIEW"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_select_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "SELECT name"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_update_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "UPDATE VIEW"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_or_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "true OR false"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
-
-
-def test_text_with_table_reserved_word_raise_an_error():
-    # Arrange
-    special_text = "FLUSH TABLE users"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Username.create(special_text)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Text contains an invalid word"
+    assert error_message == INVALID_CHARACTER_MESSAGE
 
 
 def test_object_with_valid_length_is_created():
@@ -761,20 +341,6 @@ def test_object_with_valid_length_is_created():
     assert result.value == "Admin123"
 
 
-def test_object_with_short_value_raise_an_error():
-    # Arrange
-    password = "12345"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Password.create(password)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Password must be 8 characters or more"
-
-
 def test_object_with_equal_value_is_created():
     # Arrange
     usa = "US"
@@ -786,20 +352,6 @@ def test_object_with_equal_value_is_created():
     assert result.value == "US"
 
 
-def test_object_with_not_equal_value_raise_an_error():
-    # Arrange
-    usa = "USA"
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = CountryID.create(usa)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "CountryID should be equal to 2"
-
-
 def test_object_with_lower_value_is_created():
     # Arrange
     total = 500
@@ -811,20 +363,6 @@ def test_object_with_lower_value_is_created():
     assert result.value == 500
 
 
-def test_object_with_not_lower_value_raise_an_error():
-    # Arrange
-    total = 1500
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Capacity.create(total)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Capacity must be less than 1000"
-
-
 def test_object_with_value_within_limits_is_created():
     # Arrange
     fifty = 50
@@ -836,29 +374,15 @@ def test_object_with_value_within_limits_is_created():
     assert result.years == 50
 
 
-def test_object_with_value_less_raise_error():
-    # Arrange
-    negative_quantity = -3
-
-    # Act
-    with pytest.raises(ValueError) as error:
-        _ = Amount.create(negative_quantity)
-
-    error_message = str(error.value)
-
-    # Assert
-    assert error_message == "Amount must be greater than 0"
-
-
-def test_object_with_value_greater_raise_error():
+def test_guard_with_explicit_name_raise_error_with_given_name():
     # Arrange
-    value_over = 110
+    empty_value = ""
 
     # Act
     with pytest.raises(ValueError) as error:
-        _ = Amount.create(value_over)
+        Guard.is_not_null_or_empty(empty_value, name="Nickname")
 
     error_message = str(error.value)
 
     # Assert
-    assert error_message == "Amount must be less than or equal to 100"
+    assert error_message == "Nickname cannot be null nor empty"
@@ -1,4 +1,6 @@
+import logging
 from dataclasses import dataclass
+from logging import Logger
 from uuid import UUID
 
 import pytest
@@ -9,20 +11,20 @@ from sharedkernel.infrastructure.errors import UnsupportedEventHandler
 from sharedkernel.infrastructure.services import EventBroker
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterUser(Command):
     user_id: UUID
     name: str
     slug: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserRegistered(DomainEvent):
     event_id: str
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserLoggedIn(DomainEvent):
     event_id: str
     message: str
@@ -30,14 +32,20 @@ class UserLoggedIn(DomainEvent):
 
 class RegistrationEventHandler(DomainEventHandler[UserRegistered]):
 
+    def __init__(self, logger: Logger):
+        self._logger = logger
+
     def process(self, event: UserRegistered, position: int):
-        print(f"{event.event_id} event processed by {type(self).__name__}")
+        self._logger.info("%s event processed by %s", event.event_id, type(self).__name__)
 
 
 class EmailUserEventHandler(DomainEventHandler[UserRegistered]):
 
+    def __init__(self, logger: Logger):
+        self._logger = logger
+
     def process(self, event: UserRegistered, position: int):
-        print(f"{event.event_id} event processed by {type(self).__name__}")
+        self._logger.info("%s event processed by %s", event.event_id, type(self).__name__)
 
 
 class RegisterUserCommandHandler(CommandHandler[RegisterUser]):
@@ -48,7 +56,7 @@ class RegisterUserCommandHandler(CommandHandler[RegisterUser]):
 
 def test_event_handler_is_subscribed_to_event_broker(fake_logger):
     # Arrange
-    event_handler = RegistrationEventHandler()
+    event_handler = RegistrationEventHandler(fake_logger)
     event_broker = EventBroker(fake_logger)
 
     # Act
@@ -60,8 +68,8 @@ def test_event_handler_is_subscribed_to_event_broker(fake_logger):
 
 def test_two_event_handlers_are_subscribed_to_event_broker(fake_logger):
     # Arrange
-    registration_handler = RegistrationEventHandler()
-    email_handler = EmailUserEventHandler()
+    registration_handler = RegistrationEventHandler(fake_logger)
+    email_handler = EmailUserEventHandler(fake_logger)
 
     event_broker = EventBroker(fake_logger)
 
@@ -90,12 +98,13 @@ def test_subscribe_not_event_handler_to_event_broker_raise_error(fake_logger):
     assert str(error.value) == expected
 
 
-def test_domain_event_is_processed_by_subscribed_handler(fake_logger, capture_stdout):
+def test_domain_event_is_processed_by_subscribed_handler(fake_logger, caplog):
     # Arrange
-    event_handler = RegistrationEventHandler()
+    caplog.set_level(logging.INFO)
+    event_handler = RegistrationEventHandler(logging.getLogger(__name__))
     event_broker = EventBroker(fake_logger)
     subscription_result = event_broker.subscribe(event_handler)
-    console = "UserRegistered event processed by RegistrationEventHandler\n"
+    expected = ["UserRegistered event processed by RegistrationEventHandler"]
 
     # Act
     event = UserRegistered(event_id="UserRegistered", message="User(name='John Doe')")
@@ -103,12 +112,13 @@ def test_domain_event_is_processed_by_subscribed_handler(fake_logger, capture_st
 
     # Assert
     assert subscription_result is True
-    assert capture_stdout["console"] == console
+    assert caplog.messages == expected
 
 
-def test_domain_event_is_not_processed_when_no_subscribed_handler(fake_logger, capture_stdout):
+def test_domain_event_is_not_processed_when_no_subscribed_handler(fake_logger, caplog):
     # Arrange
-    event_handler = RegistrationEventHandler()
+    caplog.set_level(logging.INFO)
+    event_handler = RegistrationEventHandler(logging.getLogger(__name__))
     event_broker = EventBroker(fake_logger)
     subscription_result = event_broker.subscribe(event_handler)
 
@@ -118,4 +128,4 @@ def test_domain_event_is_not_processed_when_no_subscribed_handler(fake_logger, c
 
     # Assert
     assert subscription_result is True
-    assert not capture_stdout["console"]
+    assert not caplog.messages
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, replace
 from datetime import datetime
 from functools import singledispatchmethod
 from uuid import UUID
@@ -8,18 +9,23 @@ import pytest
 from sharedkernel.domain.events import DomainEvent
 from sharedkernel.infrastructure.data import DataModel, Event
 from sharedkernel.infrastructure.errors import UnprocessableListener, MapperNotFound
-from sharedkernel.infrastructure.projections import Projector, Projection
+from sharedkernel.infrastructure.projections import Projector, Projection, handles
 from sharedkernel.infrastructure.services import EventDispatcher, MappingPipeline
 
+LOGGER = logging.getLogger(__name__)
+EVENT_ID = UUID('018f55de-8321-7efd-a4e3-fcc2c5ec5eea')
+USER_ID = UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c')
+CORRELATION_ID = UUID('018fa862-800b-7b6a-8690-ba0e06908c26')
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class UserRegistered(DomainEvent):
     user_id: UUID
     name: str
     slug: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserNameUpdated(DomainEvent):
     user_id: UUID
     new_name: str
@@ -38,18 +44,14 @@ class UserDetailsProjection(Projection[UserModel]):
         return 0
 
     def update_position(self, entity_id: UUID, event_type: str, position: int) -> None:
-        print(f"{event_type} event processed by '{self.__class__.__name__}'")
-
-    @singledispatchmethod
-    def apply(self, event: DomainEvent) -> None:
-        super().apply(event)
+        LOGGER.info("%s event processed by '%s'", event_type, type(self).__name__)
 
-    @apply.register
-    def _when(self, event: UserRegistered) -> None:
+    @handles(UserRegistered)
+    def _when_registered(self, event: UserRegistered) -> None:
         pass
 
-    @apply.register
-    def _when(self, event: UserNameUpdated) -> None:
+    @handles(UserNameUpdated)
+    def _when_name_updated(self, event: UserNameUpdated) -> None:
         pass
 
 
@@ -59,14 +61,10 @@ class AccountDetailsProjection(Projection[UserModel]):
         return 0
 
     def update_position(self, entity_id: UUID, event_type: str, position: int) -> None:
-        print(f"{event_type} event processed by '{self.__class__.__name__}'")
+        LOGGER.info("%s event processed by '%s'", event_type, type(self).__name__)
 
-    @singledispatchmethod
-    def apply(self, event: DomainEvent) -> None:
-        super().apply(event)
-
-    @apply.register
-    def _when(self, event: UserNameUpdated) -> None:
+    @handles(UserNameUpdated)
+    def _when_name_updated(self, event: UserNameUpdated) -> None:
         pass
 
 
@@ -76,23 +74,59 @@ class UserListProjection(Projection[UserModel]):
         return 0
 
     def update_position(self, entity_id: UUID, event_type: str, position: int) -> None:
-        print(f"{event_type} event processed by '{self.__class__.__name__}'")
+        LOGGER.info("%s event processed by '%s'", event_type, type(self).__name__)
 
     @singledispatchmethod
     def apply(self, event: DomainEvent) -> None:
         super().apply(event)
 
 
+class UserStreamProjection(UserDetailsProjection):
+
+    def __init__(self):
+        self.position = 0
+
+    def get_position(self, entity_id: UUID, event_type: str) -> int:
+        return self.position
+
+    def update_position(self, entity_id: UUID, event_type: str, position: int) -> None:
+        self.position = position
+        LOGGER.info("%s event at position %s processed by '%s'", event_type, position, type(self).__name__)
+
+
 class FakeDomainEventMapper(MappingPipeline):
 
     def map(self, data: dict, data_type: str):
         return UserRegistered(
-            user_id=UUID("018f9284-769b-726d-b3bf-3885bf2ddd3c"),
+            user_id=USER_ID,
             name="John Doe Smith",
             slug="john-doe-smith"
         )
 
 
+class TypedDomainEventMapper(FakeDomainEventMapper):
+
+    def map(self, data: dict, data_type: str):
+        if data_type == "UserNameUpdated":
+            return UserNameUpdated(
+                user_id=USER_ID,
+                new_name="John Doe",
+                previous_name="John Doe Smith"
+            )
+        return super().map(data, data_type)
+
+
+class RecordingDomainEventMapper(FakeDomainEventMapper):
+
+    def __init__(self):
+        super().__init__()
+        self.data = None
+
+    def map(self, data: dict, data_type: str):
+        self.data = data
+        return super().map(data, data_type)
+
+
 class NoDomainEventMapper(MappingPipeline):
 
     def map(self, _: dict, __: str):
@@ -146,18 +180,19 @@ def test_projector_with_no_handled_event_raise_error(fake_logger):
     assert str(error.value) == "Cannot subscribe `Projector of UserListProjection` because it does not handle any event"
 
 
-def test_event_is_processed_by_subscribed_listener(fake_logger, capture_stdout):
+def test_event_is_processed_by_subscribed_listener(fake_logger, caplog):
     # Arrange
+    caplog.set_level(logging.INFO)
     event = Event(
-        event_id=UUID("018f55de-8321-7efd-a4e3-fcc2c5ec5eea"),
+        event_id=EVENT_ID,
         event_type="UserRegistered",
         position=1,
         data='{"user_id":"018f9284-769b-726d-b3bf-3885bf2ddd3c",   "name":"John Doe Smith",   "slug":"john-doe-smith"}',
-        stream_id=UUID("018f9284-769b-726d-b3bf-3885bf2ddd3c"),
+        stream_id=USER_ID,
         stream_type="User",
         version=1,
         created=datetime.fromisoformat('2024-04-28T12:30:12-04:00'),
-        correlation_id=UUID('018fa862-800b-7b6a-8690-ba0e06908c26'),
+        correlation_id=CORRELATION_ID,
     )
 
     projection = UserDetailsProjection()
@@ -165,28 +200,29 @@ def test_event_is_processed_by_subscribed_listener(fake_logger, capture_stdout):
     fake_mapper = FakeDomainEventMapper()
     event_dispatcher = EventDispatcher(logger=fake_logger, mapper=fake_mapper)
     subscription_result = event_dispatcher.subscribe(listener)
-    console = "UserRegistered event processed by 'UserDetailsProjection'\n"
+    expected = ["UserRegistered event processed by 'UserDetailsProjection'"]
 
     # Act
     event_dispatcher.dispatch(event)
 
     # Assert
     assert subscription_result is True
-    assert capture_stdout["console"] == console
+    assert caplog.messages == expected
 
 
-def test_no_event_is_processed_when_no_event_listener(fake_logger, capture_stdout):
+def test_no_event_is_processed_when_no_event_listener(fake_logger, caplog):
     # Arrange
+    caplog.set_level(logging.INFO)
     event = Event(
-        event_id=UUID("018f55de-8321-7efd-a4e3-fcc2c5ec5eea"),
+        event_id=EVENT_ID,
         event_type="UserRegistered",
         position=1,
         data='{"user_id":"018f9284-769b-726d-b3bf-3885bf2ddd3c",   "name":"John Doe Smith",   "slug":"john-doe-smith"}',
-        stream_id=UUID("018f9284-769b-726d-b3bf-3885bf2ddd3c"),
+        stream_id=USER_ID,
         stream_type="User",
         version=1,
         created=datetime.fromisoformat('2024-04-28T12:30:12-04:00'),
-        correlation_id=UUID('018fa862-800b-7b6a-8690-ba0e06908c26'),
+        correlation_id=CORRELATION_ID,
     )
 
     projection = AccountDetailsProjection()
@@ -200,21 +236,21 @@ def test_no_event_is_processed_when_no_event_listener(fake_logger, capture_stdou
 
     # Assert
     assert subscription_result is True
-    assert not capture_stdout["console"]
+    assert not caplog.messages
 
 
 def test_projector_with_no_event_mapper_raise_error(fake_logger):
     # Arrange
     event = Event(
-        event_id=UUID("018f55de-8321-7efd-a4e3-fcc2c5ec5eea"),
+        event_id=EVENT_ID,
         event_type="UserRegistered",
         position=1,
         data='{"user_id":"018f9284-769b-726d-b3bf-3885bf2ddd3c",   "name":"John Doe Smith",   "slug":"john-doe-smith"}',
-        stream_id=UUID("018f9284-769b-726d-b3bf-3885bf2ddd3c"),
+        stream_id=USER_ID,
         stream_type="User",
         version=1,
         created=datetime.fromisoformat('2024-04-28T12:30:12-04:00'),
-        correlation_id=UUID('018fa862-800b-7b6a-8690-ba0e06908c26'),
+        correlation_id=CORRELATION_ID,
     )
 
     projection = UserDetailsProjection()
@@ -229,3 +265,71 @@ def test_projector_with_no_event_mapper_raise_error(fake_logger):
 
     # Assert
     assert str(error.value) == "No Event Mapper was found for event UserRegistered."
+
+
+def test_event_with_decoded_data_is_dispatched_without_parsing(fake_logger, caplog):
+    # Arrange
+    caplog.set_level(logging.INFO)
+    data = {"user_id": "018f9284-769b-726d-b3bf-3885bf2ddd3c", "name": "John Doe Smith", "slug": "john-doe-smith"}
+    event = Event(
+        event_id=EVENT_ID,
+        event_type="UserRegistered",
+        position=1,
+        data=data,
+        stream_id=USER_ID,
+        stream_type="User",
+        version=1,
+        created=datetime.fromisoformat('2024-04-28T12:30:12-04:00'),
+        correlation_id=CORRELATION_ID,
+    )
+
+    projection = UserDetailsProjection()
+    listener = Projector(fake_logger, projection)
+    recording_mapper = RecordingDomainEventMapper()
+    event_dispatcher = EventDispatcher(logger=fake_logger, mapper=recording_mapper)
+    event_dispatcher.subscribe(listener)
+    expected = ["UserRegistered event processed by 'UserDetailsProjection'"]
+
+    # Act
+    event_dispatcher.dispatch(event)
+
+    # Assert
+    assert recording_mapper.data is data
+    assert caplog.messages == expected
+
+
+def test_events_are_dispatched_in_order_to_subscribed_listeners(fake_logger, caplog):
+    # Arrange
+    caplog.set_level(logging.INFO)
+    name_updated = Event(
+        event_id=EVENT_ID,
+        event_type="UserNameUpdated",
+        position=1,
+        data=('{"user_id":"018f9284-769b-726d-b3bf-3885bf2ddd3c",'
+              '"new_name":"John Doe","previous_name":"John Doe Smith"}'),
+        stream_id=USER_ID,
+        stream_type="User",
+        version=1,
+        created=datetime.fromisoformat('2024-04-28T12:30:12-04:00'),
+        correlation_id=CORRELATION_ID,
+    )
+    registered = replace(name_updated, event_type="UserRegistered", position=2, version=2)
+    renamed = replace(name_updated, position=3, version=3)
+    logged_in = replace(name_updated, event_type="UserLoggedIn", position=4, version=4)
+
+    projection = UserStreamProjection()
+    listener = Projector(fake_logger, projection)
+    typed_mapper = TypedDomainEventMapper()
+    event_dispatcher = EventDispatcher(logger=fake_logger, mapper=typed_mapper)
+    event_dispatcher.subscribe(listener)
+    expected = [
+        "UserNameUpdated event at position 1 processed by 'UserStreamProjection'",
+        "UserRegistered event at position 2 processed by 'UserStreamProjection'",
+        "UserNameUpdated event at position 3 processed by 'UserStreamProjection'",
+    ]
+
+    # Act
+    event_dispatcher.dispatch_many([name_updated, registered, renamed, logged_in])
+
+    # Assert
+    assert caplog.messages == expected
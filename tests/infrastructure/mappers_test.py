@@ -5,16 +5,19 @@ from uuid import UUID
 
 from sharedkernel.domain.events import DomainEvent
 from sharedkernel.infrastructure.data import Event
-from sharedkernel.infrastructure.mappers import Mapper, MappersChain, MappingPipeline, extract, to_event
+from sharedkernel.infrastructure.mappers import (ConstructorMapping, Mapper, MappersChain, MappingPipeline, extract,
+                                                 to_event)
 
+USER_ID = UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c')
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class UserRegistered(DomainEvent):
     user_id: UUID
     email: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserLoggedIn(DomainEvent):
     name: str
     email: str
@@ -44,6 +47,19 @@ class UserLoggedInMapper(Mapper[UserLoggedIn]):
         return self.map_next(data, event_type)
 
 
+class UserCreatedMapper(Mapper[UserRegistered]):
+    LEGACY_TYPE = "UserCreated"
+
+    def map(self, data: Dict[str, Any], event_type: str) -> Optional[UserRegistered]:
+        if event_type != self.LEGACY_TYPE:
+            return self.map_next(data, event_type)
+
+        return UserRegistered(
+            user_id=UUID(data['user_id']),
+            email=data['email'],
+        )
+
+
 def test_extract_json_string_from_quoted_json_string():
     # Arrange
     expected = '{\"user_id\": \"018f9284-769b-726d-b3bf-3885bf2ddd3c\", \"email\": \"john-doe@example.com\"}'
@@ -107,7 +123,7 @@ def test_deserialize_json_string_to_event():
 def test_mapper_return_domain_event_with_valid_data():
     # Arrange
     expected = UserRegistered(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         email="john-doe@example.com",
     )
 
@@ -141,7 +157,7 @@ def test_mapper_return_none_with_invalid_data():
 def test_mapper_chain_return_events_with_valid_data():
     # Arrange
     user_registered = UserRegistered(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         email="john-doe@example.com",
     )
 
@@ -173,6 +189,31 @@ def test_mapper_chain_return_events_with_valid_data():
     assert logged_in_result == user_logged_in
 
 
+def test_mapper_chain_return_event_mapped_by_legacy_type_mapper():
+    # Arrange
+    expected = UserRegistered(
+        user_id=USER_ID,
+        email="john-doe@example.com",
+    )
+
+    created_data = {"user_id": "018f9284-769b-726d-b3bf-3885bf2ddd3c", "email": "john-doe@example.com"}
+    created_type = "UserCreated"
+
+    created_mapper = UserCreatedMapper()
+    logged_in_mapper = UserLoggedInMapper()
+
+    chain = MappersChain()
+
+    # Act
+    chain.add(created_mapper)
+    chain.add(logged_in_mapper)
+
+    result = chain.map(created_data, created_type)
+
+    # Assert
+    assert result == expected
+
+
 def test_mapper_chain_return_none_when_different_mapper_added():
     # Arrange
     registered_data = {"user_id": "018f9284-769b-726d-b3bf-3885bf2ddd3c", "email": "john-doe@example.com"}
@@ -208,7 +249,7 @@ def test_mapper_chain_return_none_when_no_mapper_added():
 def test_mapping_pipeline_return_event_with_valid_data():
     # Arrange
     expected = UserRegistered(
-        user_id=UUID('018f9284-769b-726d-b3bf-3885bf2ddd3c'),
+        user_id=USER_ID,
         email="john-doe@example.com",
     )
 
@@ -232,6 +273,80 @@ def test_mapping_pipeline_return_event_with_valid_data():
     assert result == expected
 
 
+def test_constructor_mapping_return_event_with_valid_data():
+    # Arrange
+    expected = UserLoggedIn(name="John Doe", email="john-doe@example.com")
+
+    logged_in_data = {"name": "John Doe", "email": "john-doe@example.com"}
+    logged_in_type = "UserLoggedIn"
+
+    constructors = ConstructorMapping()
+    constructors.add(UserLoggedIn)
+
+    pipeline = MappingPipeline()
+    pipeline.register(constructors)
+
+    # Act
+    result = pipeline.map(logged_in_data, logged_in_type)
+
+    # Assert
+    assert result == expected
+
+
+def test_constructor_mapping_return_none_when_data_does_not_match():
+    # Arrange
+    logged_in_data = {"username": "John Doe", "email": "john-doe@example.com"}
+    logged_in_type = "UserLoggedIn"
+
+    constructors = ConstructorMapping()
+    constructors.add(UserLoggedIn)
+
+    # Act
+    result = constructors.map(logged_in_data, logged_in_type)
+
+    # Assert
+    assert result is None
+
+
+def test_mapping_pipeline_falls_through_constructor_mapping_when_data_does_not_match():
+    # Arrange
+    expected = UserLoggedIn(name="John Doe", email="john-doe@example.com")
+
+    logged_in_data = {"name": "John Doe", "email": "john-doe@example.com", "ip_address": "127.0.0.1"}
+    logged_in_type = "UserLoggedIn"
+
+    constructors = ConstructorMapping()
+    constructors.add(UserLoggedIn)
+
+    chain = MappersChain()
+    chain.add(UserLoggedInMapper())
+
+    pipeline = MappingPipeline()
+    pipeline.register(constructors)
+    pipeline.register(chain)
+
+    # Act
+    result = pipeline.map(logged_in_data, logged_in_type)
+
+    # Assert
+    assert result == expected
+
+
+def test_constructor_mapping_return_none_when_type_not_added():
+    # Arrange
+    registered_data = {"user_id": "018f9284-769b-726d-b3bf-3885bf2ddd3c", "email": "john-doe@example.com"}
+    registered_type = "UserRegistered"
+
+    constructors = ConstructorMapping()
+    constructors.add(UserLoggedIn)
+
+    # Act
+    result = constructors.map(registered_data, registered_type)
+
+    # Assert
+    assert result is None
+
+
 def test_mapping_pipeline_return_event_when_no_mapping_behavior():
     # Arrange
     registered_data = {"user_id": "018f9284-769b-726d-b3bf-3885bf2ddd3c", "email": "john-doe@example.com"}
@@ -244,3 +359,49 @@ def test_mapping_pipeline_return_event_when_no_mapping_behavior():
 
     # Assert
     assert result is None
+
+
+def test_frozen_mapping_pipeline_return_event_with_valid_data():
+    # Arrange
+    expected = UserRegistered(
+        user_id=USER_ID,
+        email="john-doe@example.com",
+    )
+
+    registered_data = {"user_id": "018f9284-769b-726d-b3bf-3885bf2ddd3c", "email": "john-doe@example.com"}
+    registered_type = "UserRegistered"
+
+    chain = MappersChain()
+    chain.add(UserRegisteredMapper())
+    chain.add(UserLoggedInMapper())
+
+    pipeline = MappingPipeline()
+    pipeline.register(chain)
+
+    # Act
+    map_event = pipeline.freeze()
+
+    result = map_event(registered_data, registered_type)
+
+    # Assert
+    assert result == expected
+
+
+def test_frozen_mapping_pipeline_ignores_behaviors_registered_later():
+    # Arrange
+    registered_data = {"user_id": "018f9284-769b-726d-b3bf-3885bf2ddd3c", "email": "john-doe@example.com"}
+    registered_type = "UserRegistered"
+
+    chain = MappersChain()
+    chain.add(UserRegisteredMapper())
+
+    pipeline = MappingPipeline()
+
+    # Act
+    map_event = pipeline.freeze()
+    pipeline.register(chain)
+
+    result = map_event(registered_data, registered_type)
+
+    # Assert
+    assert result is None
@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass
 from functools import singledispatchmethod
 from uuid import UUID
@@ -8,30 +9,33 @@ from sharedkernel.domain.errors import UnknownEvent
 from sharedkernel.domain.events import DomainEvent
 from sharedkernel.infrastructure.data import DataModel
 from sharedkernel.infrastructure.errors import OutOfOrderEvent
-from sharedkernel.infrastructure.projections import Projection, Projector
+from sharedkernel.infrastructure.projections import Projection, Projector, handles
 
+LOGGER = logging.getLogger(__name__)
+ENTITY_ID = UUID('018f55de-8321-7efd-a4e3-fcc2c5ec5eea')
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class UserRegistered(DomainEvent):
     user_id: int
     name: str
     slug: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserNameUpdated(DomainEvent):
     user_id: int
     new_name: str
     previous_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserLoggedIn(DomainEvent):
     name: str
     email: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserModel(DataModel):
     user_id: int
     name: str
@@ -44,19 +48,38 @@ class UserDetailsProjection(Projection[UserModel]):
         return 1
 
     def update_position(self, entity_id: UUID, event_type: str, position: int) -> None:
-        print(f"{event_type} event processed by '{self.__class__.__name__}'")
+        LOGGER.info("%s event processed by '%s'", event_type, type(self).__name__)
+
+    @handles(UserRegistered)
+    def _when_registered(self, event: UserRegistered) -> None:
+        pass
+
+    @handles(UserNameUpdated)
+    def _when_name_updated(self, event: UserNameUpdated) -> None:
+        pass
+
+
+class UserNamesProjection(Projection[UserModel]):
+
+    def get_position(self, entity_id: UUID, event_type: str) -> int:
+        return 1
+
+    def update_position(self, entity_id: UUID, event_type: str, position: int) -> None:
+        LOGGER.info("%s event processed by '%s'", event_type, type(self).__name__)
 
     @singledispatchmethod
     def apply(self, event: DomainEvent) -> None:
         super().apply(event)
 
-    @apply.register
-    def _when(self, event: UserRegistered) -> None:
-        pass
-
     @apply.register
     def _when(self, event: UserNameUpdated) -> None:
-        pass
+        LOGGER.info("%s renamed to %s", event.previous_name, event.new_name)
+
+
+class UserRenamesProjection(UserDetailsProjection):
+
+    def _when_name_updated(self, event: UserNameUpdated) -> None:
+        LOGGER.info("%s renamed to %s", event.previous_name, event.new_name)
 
 
 def test_projection_type():
@@ -89,7 +112,7 @@ def test_projector_handles_projection_events(fake_logger):
 
 def test_projector_process_event_out_of_order_raise_error(fake_logger):
     # Arrange
-    entity_id = UUID("018f55de-8321-7efd-a4e3-fcc2c5ec5eea")
+    entity_id = ENTITY_ID
 
     event = UserRegistered(user_id=101, name="John Doe", slug="john-doe")
 
@@ -104,11 +127,14 @@ def test_projector_process_event_out_of_order_raise_error(fake_logger):
         # Assert
     assert str(error.value) == ("Event out of order received at position 3 for Projection "
                                 "'018f55de-8321-7efd-a4e3-fcc2c5ec5eea'.")
+    assert error.value.entity_id == str(entity_id)
+    assert error.value.position == 3
 
 
-def test_projector_process_already_applied_event(fake_logger, capture_stdout):
+def test_projector_process_already_applied_event(fake_logger, caplog):
     # Arrange
-    entity_id = UUID("018f55de-8321-7efd-a4e3-fcc2c5ec5eea")
+    caplog.set_level(logging.INFO)
+    entity_id = ENTITY_ID
 
     event = UserRegistered(user_id=101, name="John Doe", slug="john-doe")
 
@@ -120,12 +146,38 @@ def test_projector_process_already_applied_event(fake_logger, capture_stdout):
     projector.process(event, position=1, entity_id=entity_id)
 
     # Assert
-    assert not capture_stdout["console"]
+    assert not caplog.messages
+
+
+def test_projector_process_many_events_in_order(fake_logger, caplog):
+    # Arrange
+    caplog.set_level(logging.INFO)
+    expected = [
+        "UserRegistered event processed by 'UserDetailsProjection'",
+        "UserNameUpdated event processed by 'UserDetailsProjection'",
+    ]
+
+    registered = UserRegistered(user_id=101, name="John Doe", slug="john-doe")
+    name_updated = UserNameUpdated(user_id=101, new_name="Jane Doe", previous_name="John Doe")
+
+    projection = UserDetailsProjection()
+
+    projector = Projector(fake_logger, projection)
+
+    # Act
+    projector.process_many([
+        (registered, 2, ENTITY_ID),
+        (name_updated, 1, ENTITY_ID),
+        (name_updated, 2, ENTITY_ID),
+    ])
+
+    # Assert
+    assert caplog.messages == expected
 
 
 def test_projector_process_unknown_event_raise_error(fake_logger):
     # Arrange
-    entity_id = UUID("018f55de-8321-7efd-a4e3-fcc2c5ec5eea")
+    entity_id = ENTITY_ID
 
     event = UserLoggedIn(name="John Doe", email="john-doe@email.com")
 
@@ -139,3 +191,114 @@ def test_projector_process_unknown_event_raise_error(fake_logger):
 
         # Assert
     assert str(error.value) == "Event 'UserLoggedIn' cannot be applied to 'UserDetailsProjection'"
+
+
+def test_projector_handles_singledispatch_projection_events(fake_logger):
+    # Arrange
+    expected = ["UserNameUpdated"]
+
+    projection = UserNamesProjection()
+
+    projector = Projector(fake_logger, projection)
+
+    # Act
+    result = projector.handles
+
+    # Assert
+    assert result == expected
+
+
+def test_singledispatch_projection_applies_handled_event(caplog):
+    # Arrange
+    caplog.set_level(logging.INFO)
+    event = UserNameUpdated(user_id=101, new_name="Jane Doe", previous_name="John Doe")
+
+    projection = UserNamesProjection()
+
+    # Act
+    projection.apply(event)
+
+    # Assert
+    assert caplog.messages == ["John Doe renamed to Jane Doe"]
+
+
+def test_singledispatch_projection_apply_unknown_event_raise_error():
+    # Arrange
+    event = UserRegistered(user_id=101, name="John Doe", slug="john-doe")
+
+    projection = UserNamesProjection()
+
+    # Act
+    with pytest.raises(UnknownEvent) as error:
+        projection.apply(event)
+
+    # Assert
+    assert str(error.value) == "Event 'UserRegistered' cannot be applied to 'UserNamesProjection'"
+
+
+def test_subclass_projection_applies_overridden_handler(caplog):
+    # Arrange
+    caplog.set_level(logging.INFO)
+    event = UserNameUpdated(user_id=101, new_name="Jane Doe", previous_name="John Doe")
+
+    projection = UserRenamesProjection()
+
+    # Act
+    projection.apply(event)
+
+    # Assert
+    assert caplog.messages == ["John Doe renamed to Jane Doe"]
+
+
+def test_subclass_projection_applies_inherited_handler(caplog):
+    # Arrange
+    caplog.set_level(logging.INFO)
+    event = UserRegistered(user_id=101, name="John Doe", slug="john-doe")
+
+    projection = UserRenamesProjection()
+
+    # Act
+    projection.apply(event)
+
+    # Assert
+    assert not caplog.messages
+
+
+def test_projector_handles_subclass_projection_events(fake_logger):
+    # Arrange
+    expected = ["UserRegistered", "UserNameUpdated"]
+
+    projection = UserRenamesProjection()
+
+    projector = Projector(fake_logger, projection)
+
+    # Act
+    result = projector.handles
+
+    # Assert
+    assert result == expected
+
+
+def test_singledispatch_projection_applies_handler_registered_later(caplog):
+    # Arrange
+    caplog.set_level(logging.INFO)
+
+    class UserSlugsProjection(UserNamesProjection):
+
+        @singledispatchmethod
+        def apply(self, event: DomainEvent) -> None:
+            super().apply(event)
+
+    @UserSlugsProjection.apply.register
+    def _when(self, event: UserRegistered) -> None:
+        LOGGER.info("%s registered as %s", event.name, event.slug)
+
+    event = UserRegistered(user_id=101, name="John Doe", slug="john-doe")
+
+    projection = UserSlugsProjection()
+
+    # Act
+    projection.apply(event)
+
+    # Assert
+    assert caplog.messages == ["John Doe registered as john-doe"]
@@ -1,8 +1,11 @@
 import json
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from uuid import UUID
 
-from sharedkernel.infrastructure.services import UUIDEncoder, DateTimeEncoder, ExtraEncoder
+import pytest
+
+from sharedkernel.infrastructure import services
+from sharedkernel.infrastructure.services import UUIDEncoder, DateTimeEncoder, ExtraEncoder, dumps, dumps_bytes
 
 
 def test_serialize_uuid_return_encoded_value():
@@ -65,3 +68,137 @@ def test_serialize_extra_types_return_encoded_value():
 
     # Assert
     assert result == expected
+
+
+def test_dumps_extra_types_return_compact_encoded_value():
+    # Arrange
+    expected = '{"id":"0191b0c5-8300-7c60-9700-f14bf5475624","price":100,"date":"2006-05-31T01:30:45-04:00"}'
+
+    data = {
+        'id': UUID('0191b0c5-8300-7c60-9700-f14bf5475624'),
+        'price': 100,
+        'date': datetime(
+            year=2006,
+            month=5,
+            day=31,
+            hour=1,
+            minute=30,
+            second=45,
+            tzinfo=timezone(timedelta(hours=-4)),
+        )
+    }
+
+    # Act
+    result = dumps(data)
+
+    # Assert
+    assert result == expected
+
+
+def test_dumps_bytes_extra_types_return_encoded_bytes():
+    # Arrange
+    expected = b'{"id":"0191b0c5-8300-7c60-9700-f14bf5475624","name":"Jos\xc3\xa9","date":"2006-05-31T01:30:45-04:00"}'
+
+    data = {
+        'id': UUID('0191b0c5-8300-7c60-9700-f14bf5475624'),
+        'name': "José",
+        'date': datetime(
+            year=2006,
+            month=5,
+            day=31,
+            hour=1,
+            minute=30,
+            second=45,
+            tzinfo=timezone(timedelta(hours=-4)),
+        )
+    }
+
+    # Act
+    result = dumps_bytes(data)
+
+    # Assert
+    assert result == expected
+
+
+def test_dumps_non_string_keys_return_encoded_keys():
+    # Arrange
+    expected = '{"1":"first","2":"second"}'
+
+    data = {1: "first", 2: "second"}
+
+    # Act
+    result = dumps(data)
+
+    # Assert
+    assert result == expected
+
+
+def test_dumps_without_orjson_extra_types_return_compact_encoded_value(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(services, "HAS_ORJSON", False)
+    expected = '{"id":"0191b0c5-8300-7c60-9700-f14bf5475624","name":"José","date":"2006-05-31T01:30:45-04:00"}'
+
+    data = {
+        'id': UUID('0191b0c5-8300-7c60-9700-f14bf5475624'),
+        'name': "José",
+        'date': datetime(
+            year=2006,
+            month=5,
+            day=31,
+            hour=1,
+            minute=30,
+            second=45,
+            tzinfo=timezone(timedelta(hours=-4)),
+        )
+    }
+
+    # Act
+    result = dumps(data)
+
+    # Assert
+    assert result == expected
+
+
+def test_dumps_bytes_without_orjson_extra_types_return_encoded_bytes(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(services, "HAS_ORJSON", False)
+    expected = b'{"id":"0191b0c5-8300-7c60-9700-f14bf5475624","name":"Jos\xc3\xa9"}'
+
+    data = {
+        'id': UUID('0191b0c5-8300-7c60-9700-f14bf5475624'),
+        'name': "José",
+    }
+
+    # Act
+    result = dumps_bytes(data)
+
+    # Assert
+    assert result == expected
+
+
+def test_dumps_without_orjson_unsupported_value_raise_error(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(services, "HAS_ORJSON", False)
+
+    data = {'date': date(year=2006, month=5, day=31)}
+
+    # Act
+    with pytest.raises(TypeError) as error:
+        dumps(data)
+
+    # Assert
+    assert str(error.value) == "Object of type date is not JSON serializable"
+
+
+def test_dumps_without_orjson_uuid_keys_raise_error(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(services, "HAS_ORJSON", False)
+
+    data = {UUID('0191b0c5-8300-7c60-9700-f14bf5475624'): "first"}
+
+    # Act
+    with pytest.raises(TypeError) as error:
+        dumps(data)
+
+    # Assert
+    assert str(error.value) == "keys must be str, int, float, bool or None, not UUID"